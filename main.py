@@ -1,27 +1,65 @@
 import os
+import argparse
 import logging
 from src.curator import EnhancedArticleCurator
 from src.email_digest import EmailDigest
-from src.utils import setup_logging
+from src.utils import setup_logging, load_config
 from dotenv import load_dotenv
 load_dotenv()  # This loads the .env file
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Curate articles and send the digest.")
+    parser.add_argument('--workers', type=int, default=0,
+                        help="Worker processes for queue-based curation (0 runs in-process)")
+    parser.add_argument('--queue', default=None,
+                        help="SQLite work queue path; to add other nodes, put it on a shared "
+                             "filesystem with working POSIX locks")
+    parser.add_argument('--worker', action='store_true',
+                        help="Only process tasks from --queue: of the --run-id run, or of any open "
+                             "run until none is left")
+    parser.add_argument('--run-id', default=None,
+                        help="Resume the queue run with this id instead of starting a fresh one "
+                             "(with --worker: serve only this run)")
+    parser.add_argument('--best-of', type=int, default=None, metavar='DAYS',
+                        help="Send the best articles evaluated in the last DAYS days from the history")
+    parser.add_argument('--top', type=int, default=10,
+                        help="Number of articles in a --best-of digest")
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
+
     # Setup logging
     setup_logging()
     logger = logging.getLogger(__name__)
     
     try:
+        # Sources, shard and scheduling settings; built-in defaults if the file is missing
+        config = load_config(os.environ.get('CURATOR_CONFIG', 'config.json'))
+
         # Initialize curator
         curator = EnhancedArticleCurator(
             gemini_api_key=os.environ['GEMINI_API_KEY'],
-            reddit_client_id=os.environ['REDDIT_CLIENT_ID'],
-            reddit_client_secret=os.environ['REDDIT_CLIENT_SECRET']
+            reddit_client_id=os.environ.get('REDDIT_CLIENT_ID'),
+            reddit_client_secret=os.environ.get('REDDIT_CLIENT_SECRET'),
+            config=config
         )
+
+        if args.worker:
+            from src.distributed import run_worker
+            logger.info(f"Running as queue worker on {args.queue}...")
+            run_worker(args.queue or 'curator_queue.db', curator.init_kwargs, run_id=args.run_id)
+            return
         
-        # Get curated articles
-        logger.info("Starting article curation...")
-        articles = curator.curate_articles()
+        if args.best_of is not None:
+            # Digest straight from stored evaluations, no fetching or Gemini calls
+            logger.info(f"Selecting best articles of the last {args.best_of} days...")
+            articles = curator.best_of(args.best_of, args.top)
+        else:
+            # Get curated articles
+            logger.info("Starting article curation...")
+            articles = curator.curate_articles(workers=args.workers, queue_path=args.queue,
+                                               run_id=args.run_id)
         logger.info(f"Found {len(articles)} articles")
         
         # Initialize email digest
@@ -43,6 +81,8 @@ def main():
         
         if success:
             logger.info("Email digest sent successfully")
+            # Keep these (and the coverage listed under them) out of future digests
+            curator.mark_sent(articles)
         else:
             logger.error("Failed to send email digest")
             
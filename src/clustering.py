@@ -0,0 +1,91 @@
+# src/clustering.py
+import zlib
+from typing import Dict, List, Optional
+import numpy as np
+from .condenser import STOPWORDS, WORD
+
+class HashedEmbedder:
+    """Hashed bag-of-words vectors (unigrams + bigrams) with batch IDF, L2-normalised.
+
+    Needs no model download or vocabulary: every term is hashed into `dim` buckets."""
+
+    def __init__(self, dim: int = 4096):
+        self.dim = dim
+
+    def _bucket(self, term: str) -> int:
+        return zlib.crc32(term.encode('utf-8')) % self.dim
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        counts = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            words = [w for w in WORD.findall(text.lower()) if w not in STOPWORDS and len(w) > 2]
+            terms = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+            for term in terms:
+                counts[row, self._bucket(term)] += 1
+
+        # Sublinear term frequency, weighted by how rare the term is across this batch
+        doc_freq = np.count_nonzero(counts, axis=0)
+        idf = np.log((1 + len(texts)) / (1 + doc_freq)) + 1
+        vectors = np.log1p(counts) * idf
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-9)
+
+
+class SimilarityIndex:
+    """Cosine-similarity index over normalised vectors held in one NumPy matrix."""
+
+    def __init__(self, vectors: np.ndarray):
+        self.vectors = vectors
+
+    def similarities(self, vector: np.ndarray) -> np.ndarray:
+        return self.vectors @ vector
+
+    def cluster(self, threshold: float = 0.35, order: Optional[List[int]] = None) -> List[List[int]]:
+        """Greedy leader clustering: each item joins the most similar existing leader
+        above `threshold`, otherwise it starts a new cluster. Items are visited in
+        `order`, so the first member of each cluster is its leader."""
+        order = order if order is not None else list(range(len(self.vectors)))
+        clusters: List[List[int]] = []
+        leaders = np.zeros((0, self.vectors.shape[1]), dtype=self.vectors.dtype)
+
+        for idx in order:
+            if len(clusters):
+                sims = leaders @ self.vectors[idx]
+                best = int(np.argmax(sims))
+                if sims[best] >= threshold:
+                    clusters[best].append(idx)
+                    continue
+            clusters.append([idx])
+            leaders = np.vstack([leaders, self.vectors[idx]])
+        return clusters
+
+
+def select_diverse(vectors: np.ndarray, scores: List[float], k: int,
+                   diversity: float = 0.3) -> List[int]:
+    """Maximal marginal relevance: repeatedly pick the item with the best trade-off
+    between its own score and its similarity to items already picked."""
+    if not len(scores):
+        return []
+    relevance = np.asarray(scores, dtype=np.float32)
+    span = relevance.max() - relevance.min()
+    relevance = (relevance - relevance.min()) / span if span > 0 else np.ones_like(relevance)
+
+    selected: List[int] = []
+    max_sim = np.zeros(len(scores), dtype=np.float32)
+    available = np.ones(len(scores), dtype=bool)
+    for _ in range(min(k, len(scores))):
+        mmr = (1 - diversity) * relevance - diversity * max_sim
+        mmr[~available] = -np.inf
+        best = int(np.argmax(mmr))
+        selected.append(best)
+        available[best] = False
+        max_sim = np.maximum(max_sim, vectors @ vectors[best])
+    return selected
+
+
+def embedding_text(item: Dict) -> str:
+    """Text to embed for a candidate: title plus condensed content, or its summary."""
+    article = item["article"]
+    data = item.get("data")
+    body = data["content"] if data else (article.get("description") or article.get("abstract") or "")
+    return f"{article['title']}\n{body}"
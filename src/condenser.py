@@ -0,0 +1,105 @@
+# src/condenser.py
+import math
+import re
+from collections import Counter
+from typing import List
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before
+being below between both but by can could did do does doing down during each few for from
+further had has have having he her here hers herself him himself his how i if in into is it
+its itself just me more most my myself no nor not now of off on once only or other our ours
+ourselves out over own same she should so some such than that the their theirs them
+themselves then there these they this those through to too under until up very was we were
+what when where which while who whom why will with would you your yours yourself yourselves
+said says one two may might must much many like new
+""".split())
+
+SENTENCE_SPLIT = re.compile(r'(?<=[.!?])["\')\]]*\s+(?=["\'(\[]?[A-Z0-9])')
+WORD = re.compile(r"[a-z0-9][a-z0-9'-]*")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough LLM token count (about 4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+def split_sentences(text: str) -> List[List[str]]:
+    """Split text into paragraphs of sentences."""
+    paragraphs = [p.strip() for p in re.split(r'\n\s*\n|\n', text) if p.strip()]
+    return [[s.strip() for s in SENTENCE_SPLIT.split(p) if s.strip()] for p in paragraphs]
+
+
+def condense_text(text: str, max_tokens: int = 600) -> str:
+    """Pick the most informative sentences that fit in `max_tokens`, in original order.
+
+    Sentences are scored by the TF-IDF weight of their content words (each sentence
+    treated as a document), normalised by length, with a small boost for the opening
+    sentences and for paragraph leads, which usually carry the thesis."""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    sentences = [(p_idx, s_idx, sentence)
+                 for p_idx, paragraph in enumerate(split_sentences(text))
+                 for s_idx, sentence in enumerate(paragraph)]
+    if not sentences:
+        return text[:max_tokens * 4]
+
+    terms = [[w for w in WORD.findall(sentence.lower()) if w not in STOPWORDS and len(w) > 2]
+             for _, _, sentence in sentences]
+    doc_freq = Counter(term for sentence_terms in terms for term in set(sentence_terms))
+    term_freq = Counter(term for sentence_terms in terms for term in sentence_terms)
+    n_sentences = len(sentences)
+
+    # Document-level weight of each term: frequent in the article but not in every sentence
+    weights = {term: (1 + math.log(term_freq[term])) * math.log(1 + n_sentences / doc_freq[term])
+               for term in term_freq}
+
+    scores = []
+    for idx, ((p_idx, s_idx, sentence), sentence_terms) in enumerate(zip(sentences, terms)):
+        if len(sentence_terms) < 3:
+            scores.append(0.0)
+            continue
+        score = sum(weights[term] for term in set(sentence_terms)) / math.sqrt(len(sentence_terms))
+        if idx < 3:
+            score *= 1.25
+        elif s_idx == 0:
+            score *= 1.1
+        scores.append(score)
+
+    # Greedily take the best sentences that still fit in the budget, skipping near-repeats
+    chosen = set()
+    chosen_terms = []
+    budget = max_tokens
+    for idx in sorted(range(n_sentences), key=lambda i: scores[i], reverse=True):
+        if scores[idx] <= 0:
+            break
+        cost = estimate_tokens(sentences[idx][2]) + 1
+        if cost > budget:
+            continue
+        candidate = set(terms[idx])
+        if any(len(candidate & other) / len(candidate | other) > 0.7 for other in chosen_terms):
+            continue
+        chosen.add(idx)
+        chosen_terms.append(candidate)
+        budget -= cost
+        if budget < 10:
+            break
+
+    if not chosen:
+        # No sentence fits on its own; fall back to a cut at a word boundary
+        return text[:max_tokens * 4].rsplit(' ', 1)[0] + " ..."
+
+    # Reassemble in reading order, keeping paragraph breaks and marking gaps
+    parts = []
+    previous = None
+    for idx in sorted(chosen):
+        p_idx, _, sentence = sentences[idx]
+        if previous is None:
+            parts.append(sentence if idx == 0 else "... " + sentence)
+        elif idx == previous + 1 and p_idx == sentences[previous][0]:
+            parts[-1] += " " + sentence
+        else:
+            parts.append(("" if idx == previous + 1 else "... ") + sentence)
+        previous = idx
+    return "\n\n".join(parts)
@@ -1,12 +1,19 @@
 # src/curator.py
-import google.generativeai as genai
-from typing import List, Dict
+from typing import List, Dict, Optional
+import logging
 import time
 from datetime import datetime
-import requests
-import trafilatura
+import importlib
 import json
-from .extractors import RSSExtractor, RedditExtractor, ArxivExtractor, HackerNewsExtractor
+from concurrent.futures import ThreadPoolExecutor
+from .extractors import EXTRACTOR_REGISTRY, BaseExtractor, get_extractor_class
+from .fetcher import ContentFetcher, TransientFetchError
+from .condenser import condense_text
+from .history import EvaluationHistory
+from .utils import ProgressReporter
+from .rate_limiter import get_rate_limiter, backoff_delay, is_rate_limit_error, retry_after_from_error
+
+logger = logging.getLogger(__name__)
 
 class EnhancedArticleCurator:
     # RSS feed URLs remain the same...
@@ -32,23 +39,159 @@ class EnhancedArticleCurator:
 
     ARXIV_CATEGORIES = ["cs.AI", "cs.CL", "q-fin", "physics"]
 
-    def __init__(self, gemini_api_key: str, reddit_client_id: str, reddit_client_secret: str):
-        # Initialize Gemini
-        genai.configure(api_key=gemini_api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash')
-
-        # Initialize extractors
-        self.rss_extractor = RSSExtractor(self.PUBLICATION_FEEDS)
-        self.reddit_extractor = RedditExtractor(
-            reddit_client_id, 
-            reddit_client_secret,
-            self.REDDIT_SUBREDDITS
-        )
-        self.arxiv_extractor = ArxivExtractor(self.ARXIV_CATEGORIES)
-        self.hn_extractor = HackerNewsExtractor(min_score=100)
+    # Quality thresholds an evaluation must pass to make it into a digest
+    MIN_IMPACT_SCORE = 7
+    MIN_ORIGINALITY_SCORE = 6
+
+    def __init__(self, gemini_api_key: str, reddit_client_id: Optional[str] = None,
+                 reddit_client_secret: Optional[str] = None,
+                 max_page_bytes: int = 2 * 1024 * 1024,
+                 sources: Optional[List[str]] = None,
+                 config: Optional[Dict] = None):
+        # Worker processes rebuild an identical curator from these
+        self.init_kwargs = {
+            'gemini_api_key': gemini_api_key,
+            'reddit_client_id': reddit_client_id,
+            'reddit_client_secret': reddit_client_secret,
+            'max_page_bytes': max_page_bytes,
+            'sources': sources,
+            'config': config
+        }
+
+        # Gemini is configured on first use so runs that never evaluate don't import it
+        self.gemini_api_key = gemini_api_key
+        self._model = None
+
+        config = config or {}
+        self.batch_size = config.get('batch_size', 3)  # Reduced batch size for better reliability
+        # Per-article token budget for the condensed text sent to Gemini
+        self.content_token_budget = config.get('content_token_budget', 600)
+
+        # Topic clustering before evaluation and diversity when picking the digest
+        self.cluster_threshold = config.get('cluster_threshold', 0.35)
+        self.digest_size = config.get('digest_size', 10)
+        self.diversity = config.get('diversity', 0.3)
+
+        # Evaluations persist across runs; set history_path to "" to disable
+        self.history_path = config.get('history_path', 'curator_history.db')
+        self.suppress_sent = config.get('suppress_sent', True)
+        self._history = None
+
+        # One limiter shared by Gemini, the extractors and page fetches; rates are per second
+        self.limiter = get_rate_limiter()
+        # Number of processes (local and remote queue workers) splitting these limits;
+        # queue runs with local workers default to workers + 1
+        self.rate_share = config.get('rate_share', 1)
+        self.limiter.set_share(self.rate_share)
+        self.limiter.configure('gemini', rate=config.get('gemini_rpm', 15) / 60.0)
+        for key, limits in config.get('rate_limits', {}).items():
+            self.limiter.configure(key, **limits)
+
+        # Third-party extractors register themselves when their module is imported
+        for plugin in config.get('plugins', []):
+            importlib.import_module(plugin)
+
+        # Source name -> constructor args plus optional "type" and policy overrides
+        self.source_configs = config.get('sources') or {
+            'rss': {'feeds_config': self.PUBLICATION_FEEDS},
+            'reddit': {'subreddits': self.REDDIT_SUBREDDITS},
+            'arxiv': {'categories': self.ARXIV_CATEGORIES},
+            'hackernews': {'min_score': 100},
+        }
+        self.reddit_credentials = {
+            'client_id': reddit_client_id,
+            'client_secret': reddit_client_secret
+        }
+
+        # Only configured sources are imported and built, and only when first used
+        self.sources = list(sources) if sources is not None else list(self.source_configs)
+        for source in self.sources:
+            if source not in self.source_configs:
+                raise ValueError(f"Source not configured: {source}")
+            source_type = self.source_configs[source].get('type', source)
+            if source_type not in EXTRACTOR_REGISTRY:
+                raise ValueError(f"Unknown source type: {source_type}")
+        self._extractors = {}
+
+        # This process only fetches its shard of every source's units (feeds, subreddits, ...)
+        self.shard_index = config.get('shard_index', 0)
+        self.shard_count = config.get('shard_count', 1)
+        self.max_source_workers = config.get('max_source_workers', 4)
+
+        # Bounded, streaming page downloads for content extraction; probing first
+        # skips pages whose declared size exceeds the cap without downloading them
+        self.fetcher = ContentFetcher(max_bytes=max_page_bytes,
+                                      probe_first=config.get('probe_pages', False))
 
-    def extract_article_content(self, url: str, source: str = None, article_data: Dict = None) -> str:
-            """Extract the main content from an article URL or use provided content."""
+    @property
+    def model(self):
+        """Gemini model, imported and configured lazily."""
+        if self._model is None:
+            import google.generativeai as genai
+            genai.configure(api_key=self.gemini_api_key)
+            self._model = genai.GenerativeModel('gemini-2.0-flash')
+        return self._model
+
+    @property
+    def history(self) -> Optional[EvaluationHistory]:
+        """Evaluation history, opened on first use (None when disabled)."""
+        if self._history is None and self.history_path:
+            self._history = EvaluationHistory(self.history_path)
+        return self._history
+
+    def get_extractor(self, source: str):
+        """Build (once) and return this shard's extractor for a configured source.
+
+        Returns None when the shard has no units of the source."""
+        if source not in self._extractors:
+            args = dict(self.source_configs[source])
+            source_type = args.pop('type', source)
+            policy = {key: args.pop(key) for key in BaseExtractor.POLICY_KEYS if key in args}
+            if source_type == 'reddit':
+                for key, value in self.reddit_credentials.items():
+                    args.setdefault(key, value)
+
+            extractor = get_extractor_class(source_type)(**args)
+            extractor.apply_policy(policy)
+            extractor.source_name = source
+            extractor.listing_cache = self.history
+            self._extractors[source] = extractor.shard(self.shard_index, self.shard_count)
+        return self._extractors[source]
+
+    def fetch_all_articles(self, days_ago: int = 7) -> List[Dict]:
+        """Fetch every configured source, scheduled by declared cost and concurrency."""
+        jobs = []
+        for order, source in enumerate(self.sources):
+            extractor = self.get_extractor(source)
+            if extractor is None:
+                continue
+            for part in extractor.split(extractor.concurrency):
+                jobs.append((order, source, part))
+
+        # Longest jobs first so cheap sources fill in around them
+        jobs.sort(key=lambda job: job[2].estimated_cost(), reverse=True)
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max(1, self.max_source_workers)) as pool:
+            futures = [(order, source, pool.submit(part.get_cached_articles, days_ago))
+                       for order, source, part in jobs]
+            for order, source, future in futures:
+                try:
+                    results.setdefault(order, []).extend(future.result())
+                except Exception as e:
+                    logger.error(f"Error fetching {source} articles: {e}")
+
+        # Keep configured source order so deduplication stays deterministic
+        all_articles = []
+        for order in sorted(results):
+            all_articles.extend(results[order])
+        return all_articles
+
+    def extract_article_content(self, url: str, source: str = None, article_data: Dict = None,
+                                raise_transient: bool = False) -> str:
+            """Extract the main content from an article URL or use provided content.
+
+            With `raise_transient`, fetch failures worth retrying raise TransientFetchError."""
             # If it's an arXiv paper, use the abstract and metadata
             if source == "arXiv" and article_data and "content" in article_data:
                 return article_data["content"]
@@ -56,8 +199,10 @@ class EnhancedArticleCurator:
             if article_data and article_data.get("is_paywalled", False):
                 return "[Content not fully accessible due to paywall]"
                 
+            import trafilatura
+
             try:
-                downloaded = trafilatura.fetch_url(url)
+                downloaded = self.fetcher.fetch(url, raise_transient=raise_transient)
                 if downloaded:
                     text = trafilatura.extract(downloaded, 
                                             include_links=False, 
@@ -66,8 +211,10 @@ class EnhancedArticleCurator:
                                             favor_precision=True)
                     return text if text else ""
                 return ""
+            except TransientFetchError:
+                raise
             except Exception as e:
-                print(f"Error extracting content from {url}: {e}")
+                logger.warning(f"Error extracting content from {url}: {e}", extra={'sample_key': 'extract-error'})
                 return ""
 
     # def evaluate_article(self, title: str, content: str, source: str, is_paywalled: bool = False) -> Dict:
@@ -223,8 +370,10 @@ class EnhancedArticleCurator:
 # Added code for batch evaluation of articles
     def batch_evaluate_articles(self, articles_data: List[Dict], batch_size: int = 5) -> List[Dict]:
             """Evaluate multiple articles in a single Gemini call."""
-            # Add sleep before API call
-            time.sleep(2)  # Sleep for 2 seconds between batches
+            from google.generativeai.types import GenerationConfig
+
+            # Gemini echoes the ids back so results can be matched to their articles
+            numbered_articles = [{"id": idx, **data} for idx, data in enumerate(articles_data)]
             
             prompt = f"""You are an expert article curator. Evaluate the following {batch_size} articles and provide a structured analysis for each.
 
@@ -239,6 +388,7 @@ class EnhancedArticleCurator:
 
     Provide your response as a JSON array of evaluations, with each evaluation following this exact structure:
     {{
+        "id": (the article's id, copied exactly),
         "impact_score": (1-10),
         "worth_reading": (boolean),
         "key_insights": ["insight1", "insight2", "insight3"],
@@ -252,32 +402,38 @@ class EnhancedArticleCurator:
 
     Here are the articles:
 
-    {articles_data}
+    {numbered_articles}
 
     Return ONLY a JSON array containing evaluations, nothing else before or after."""
 
             try:
-                # Add retry mechanism with exponential backoff
+                # Add retry mechanism with jittered exponential backoff
                 max_retries = 3
-                retry_delay = 5  # Starting delay in seconds
+                retry_delay = 5  # Base delay in seconds
                 
                 for attempt in range(max_retries):
                     try:
+                        # Pace calls through the shared limiter instead of fixed sleeps
+                        self.limiter.acquire('gemini')
                         response = self.model.generate_content(
                             prompt,
-                            generation_config=genai.types.GenerationConfig(
+                            generation_config=GenerationConfig(
                                 temperature=0.1,
                                 top_p=0.8,
                                 top_k=40
                             )
                         )
+                        self.limiter.reward('gemini')
                         break  # If successful, break the retry loop
                     except Exception as e:
+                        if is_rate_limit_error(e):
+                            # Slow every caller down and honour the server's retry delay
+                            self.limiter.penalize('gemini', retry_after_from_error(e))
                         if attempt == max_retries - 1:  # Last attempt
                             raise e
-                        print(f"Attempt {attempt + 1} failed. Retrying in {retry_delay} seconds...")
-                        time.sleep(retry_delay)
-                        retry_delay *= 2  # Exponential backoff
+                        delay = backoff_delay(attempt, base=retry_delay)
+                        logger.warning(f"Attempt {attempt + 1} failed. Retrying in {delay:.1f} seconds...")
+                        time.sleep(delay)
                 
                 # Clean and parse response
                 response_text = response.text.strip()
@@ -290,37 +446,244 @@ class EnhancedArticleCurator:
                 if not isinstance(evaluations, list):
                     evaluations = [evaluations]
                 
-                return evaluations
+                return self.align_evaluations(evaluations, len(articles_data))
                 
             except Exception as e:
-                print(f"Error in batch Gemini evaluation: {e}")
-                print(f"Raw response: {response.text if 'response' in locals() else 'No response'}")
+                logger.error(f"Error in batch Gemini evaluation: {e}")
+                logger.debug(f"Raw response: {response.text if 'response' in locals() else 'No response'}")
                 return [self.get_default_evaluation() for _ in range(len(articles_data))]
 
-    def curate_articles(self, days_ago: int = 7) -> List[Dict]:
-        """Main function to find and curate impactful articles from all sources."""
-        print("Starting article curation...")
-        
-        # Gather articles from all sources with delays
-        all_articles = []
-        
-        print("Fetching RSS articles...")
-        time.sleep(1)
-        all_articles.extend(self.rss_extractor.get_articles(days_ago))
+    def align_evaluations(self, evaluations: List, count: int) -> List[Dict]:
+        """Put Gemini's evaluations back in article order using the echoed ids.
+
+        Articles without a matching evaluation get the default (failed) one, so a short
+        or reordered response never attaches scores to the wrong article. Without any
+        ids, the response is only trusted if it has exactly one entry per article."""
+        by_id = {}
+        for evaluation in evaluations:
+            if not isinstance(evaluation, dict):
+                continue
+            idx = evaluation.get("id")
+            if isinstance(idx, int) and 0 <= idx < count and idx not in by_id:
+                by_id[idx] = {key: value for key, value in evaluation.items() if key != "id"}
+
+        if not by_id and len(evaluations) == count and all(isinstance(e, dict) for e in evaluations):
+            return evaluations
+        if len(by_id) < count:
+            logger.warning(f"Gemini returned {len(by_id)} matching evaluations for {count} articles")
+        return [by_id.get(idx) or self.get_default_evaluation() for idx in range(count)]
+
+    def get_default_evaluation(self) -> Dict:
+        """Evaluation used when Gemini fails; never passes the quality filter."""
+        return {
+            "impact_score": 5,
+            "worth_reading": False,
+            "key_insights": ["Evaluation failed"],
+            "originality_score": 5,
+            "evidence_quality": 5,
+            "target_audience": "Unknown",
+            "estimated_reading_time": 5,
+            "time_value_assessment": "Could not evaluate",
+            "confidence_in_evaluation": 0,
+            "evaluation_failed": True
+        }
+
+    def apply_history(self, articles: List[Dict]) -> tuple:
+        """Drop articles already sent in a digest and look up stored evaluations.
+
+        Returns (remaining articles, {url: stored evaluation})."""
+        if self.history is None:
+            return articles, {}
+        urls = [article["url"] for article in articles]
+        if self.suppress_sent:
+            sent = self.history.sent_urls(urls)
+            articles = [article for article in articles if article["url"] not in sent]
+        return articles, self.history.get_evaluations(article["url"] for article in articles)
+
+    def record_evaluations(self, evaluations: List[Dict], articles: List[Dict],
+                           articles_data: Optional[List[Dict]] = None):
+        """Save fresh evaluations, and the condensed text they were based on, to the history.
+
+        Failed evaluations are left to be retried."""
+        if self.history is None:
+            return
+        if len(evaluations) != len(articles):
+            # Can't tell which evaluation belongs to which article; don't store any of them
+            logger.warning(f"Not recording {len(evaluations)} evaluations for {len(articles)} articles")
+            return
+        contents = [data["content"] if data else None for data in articles_data or [None] * len(articles)]
+        self.history.record_many(
+            (article, evaluation, content)
+            for evaluation, article, content in zip(evaluations, articles, contents)
+            if not evaluation.get("evaluation_failed")
+        )
+
+    def mark_sent(self, articles: List[Dict]):
+        """Keep a sent digest's articles, and the related coverage listed under them, out of
+        future digests."""
+        if self.history is None:
+            return
+        self.history.mark_sent(
+            list(articles) + [related for article in articles for related in article.get("related", [])]
+        )
+
+    def best_of(self, days: int, k: int = 10) -> List[Dict]:
+        """Best stored evaluations of the last `days` days that pass the digest thresholds."""
+        if self.history is None:
+            raise ValueError("Evaluation history is disabled (history_path is empty)")
+        return self.history.top_k(k, since=time.time() - days * 24 * 60 * 60,
+                                  min_impact=self.MIN_IMPACT_SCORE,
+                                  min_originality=self.MIN_ORIGINALITY_SCORE)
+
+    def prepare_article(self, article: Dict, raise_transient: bool = False) -> Optional[Dict]:
+        """Extract content and build the evaluation payload, or None if the article is skipped."""
+        content = self.extract_article_content(
+            article["url"], 
+            source=article.get("source"),
+            article_data=article,
+            raise_transient=raise_transient
+        )
         
-        print("Fetching Reddit articles...")
-        time.sleep(1)
-        all_articles.extend(self.reddit_extractor.get_articles(days_ago))
+        if not content:
+            return None
+            
+        # For non-arXiv articles, check minimum length
+        if article.get("source") != "arXiv" and len(content.split()) < 800:
+            return None
         
-        print("Fetching arXiv articles...")
-        time.sleep(1)
-        all_articles.extend(self.arxiv_extractor.get_articles(days_ago))
+        return {
+            "title": article["title"],
+            # Most informative sentences within the token budget, not just the intro
+            "content": condense_text(content, self.content_token_budget),
+            "source": article["source"],
+            "is_paywalled": article.get("is_paywalled", False)
+        }
+
+    def prepare_candidate(self, article: Dict, stored_content: Optional[str] = None,
+                          evaluated: bool = False, raise_transient: bool = False) -> Optional[Dict]:
+        """Clustering candidate {"article", "data"} for an article, or None if it is skipped.
+
+        Evaluated articles use the text stored with their evaluation when there is any,
+        and are kept (without data) even if their page can no longer be extracted."""
+        if stored_content is not None:
+            return {"article": article, "data": {
+                "title": article["title"],
+                "content": stored_content,
+                "source": article["source"],
+                "is_paywalled": article.get("is_paywalled", False)
+            }}
+
+        # Extract content and prepare article data for batch evaluation
+        article_data = self.prepare_article(article, raise_transient=raise_transient and not evaluated)
+        if article_data is None and not evaluated:
+            return None
+        return {"article": article, "data": article_data}
+
+    def passes_thresholds(self, evaluation: Dict) -> bool:
+        """Whether an evaluation meets the digest's quality thresholds."""
+        return (evaluation.get("impact_score", 0) >= self.MIN_IMPACT_SCORE and
+                evaluation.get("originality_score", 0) >= self.MIN_ORIGINALITY_SCORE and
+                evaluation.get("worth_reading", False))
+
+    def select_curated(self, evaluations: List[Dict], articles: List[Dict]) -> List[Dict]:
+        """Keep the articles whose evaluation passes the quality thresholds."""
+        curated = []
+        for eval_result, orig_article in zip(evaluations, articles):
+            if self.passes_thresholds(eval_result):
+                curated.append({
+                    "title": orig_article["title"],
+                    "url": orig_article["url"],
+                    "source": orig_article["source"],
+                    "evaluation": eval_result,
+                    "related": orig_article.get("related", [])
+                })
+        return curated
+
+    def cluster_candidates(self, candidates: List[Dict], known_evaluations: Dict) -> tuple:
+        """Group candidates ({"article", "data"}) by topic and keep one per cluster.
+
+        The representative is an already-evaluated member that passes the thresholds if
+        there is one (it is free), otherwise the unevaluated member with the most
+        content, so a topic whose earlier pick was rejected still gets a new chance;
+        the others are listed on it as "related". Returns (representatives, {url: embedding})."""
+        if not candidates:
+            return [], {}
+        from .clustering import HashedEmbedder, SimilarityIndex, embedding_text
+
+        embeddings = HashedEmbedder().embed([embedding_text(item) for item in candidates])
+        vectors = {item["article"]["url"]: embeddings[idx] for idx, item in enumerate(candidates)}
+        if not self.cluster_threshold:
+            return candidates, vectors
+
+        def priority(idx):
+            item = candidates[idx]
+            content = item["data"]["content"] if item["data"] else ""
+            evaluation = known_evaluations.get(item["article"]["url"])
+            if evaluation is None:
+                rank = 1
+            else:
+                rank = 0 if self.passes_thresholds(evaluation) else 2
+            return (rank, -len(content))
+
+        order = sorted(range(len(candidates)), key=priority)
+        clusters = SimilarityIndex(embeddings).cluster(self.cluster_threshold, order)
+
+        representatives = []
+        for members in sorted(clusters, key=min):
+            leader = candidates[members[0]]
+            related = [{"title": candidates[idx]["article"]["title"],
+                        "url": candidates[idx]["article"]["url"],
+                        "source": candidates[idx]["article"]["source"]} for idx in members[1:]]
+            representatives.append({**leader, "article": {**leader["article"], "related": related}})
+
+        logger.info(f"Grouped {len(candidates)} candidates into {len(representatives)} topic clusters")
+        return representatives, vectors
+
+    def select_digest(self, ranked_articles: List[Dict], vectors: Dict) -> List[Dict]:
+        """Top `digest_size` articles, trading a little score for topic diversity (MMR)."""
+        if not self.digest_size or len(ranked_articles) <= self.digest_size:
+            return ranked_articles
+        if not all(article["url"] in vectors for article in ranked_articles):
+            return ranked_articles[:self.digest_size]
+        from .clustering import select_diverse
+        import numpy as np
+
+        matrix = np.stack([vectors[article["url"]] for article in ranked_articles])
+        scores = [article["evaluation"]["impact_score"] + article["evaluation"]["originality_score"]
+                  for article in ranked_articles]
+        picked = select_diverse(matrix, scores, self.digest_size, self.diversity)
+        return [ranked_articles[idx] for idx in picked]
+
+    def rank_articles(self, curated_articles: List[Dict]) -> List[Dict]:
+        """Sort by combined score of impact and originality."""
+        curated_articles.sort(
+            key=lambda x: (
+                x["evaluation"]["impact_score"] + 
+                x["evaluation"]["originality_score"]
+            ), 
+            reverse=True
+        )
+        return curated_articles
+
+    def curate_articles(self, days_ago: int = 7, workers: int = 0,
+                        queue_path: Optional[str] = None, run_id: Optional[str] = None) -> List[Dict]:
+        """Main function to find and curate impactful articles from all sources.
+
+        With `workers`, `queue_path` or `run_id` set, fetch/extract/evaluate run as tasks
+        on a SQLite work queue shared by worker processes (and other nodes); `run_id`
+        resumes an earlier queue run."""
+        if workers or queue_path or run_id:
+            from .distributed import curate_distributed
+            return curate_distributed(self, days_ago, queue_path or 'curator_queue.db', workers,
+                                      run_id=run_id)
+
+        logger.info("Starting article curation...")
         
-        print("Fetching HackerNews articles...")
-        time.sleep(1)
-        all_articles.extend(self.hn_extractor.get_articles(days_ago))
+        # Gather articles from all sources
+        logger.info(f"Fetching articles from {len(self.sources)} sources...")
+        all_articles = self.fetch_all_articles(days_ago)
         
-        print(f"Total articles gathered: {len(all_articles)}")
+        logger.info(f"Total articles gathered: {len(all_articles)}")
         
         # Remove duplicates based on URL
         seen_urls = set()
@@ -330,91 +693,54 @@ class EnhancedArticleCurator:
                 seen_urls.add(article["url"])
                 unique_articles.append(article)
         
-        print(f"Unique articles after deduplication: {len(unique_articles)}")
+        logger.info(f"Unique articles after deduplication: {len(unique_articles)}")
+
+        # Skip already-sent articles and reuse evaluations from earlier runs
+        unique_articles, known_evaluations = self.apply_history(unique_articles)
+        logger.info(f"Articles to consider: {len(unique_articles)} ({len(known_evaluations)} already evaluated)")
         
-        # Process articles in batches
-        batch_size = 3  # Reduced batch size for better reliability
-        curated_articles = []
-        current_batch = []
-        batch_data = []
+        # Extract and condense every candidate first so similar stories can be grouped;
+        # evaluated ones are embedded from the text stored with their evaluation
+        stored_contents = self.history.get_contents(known_evaluations) if known_evaluations else {}
+        candidates = []
+        progress = ProgressReporter(len(unique_articles), "Extracting articles", logger)
         
-        for idx, article in enumerate(unique_articles):
-            print(f"Processing article {idx + 1}/{len(unique_articles)}")
-            
-            # Add small delay between content extractions
-            time.sleep(0.5)
-            
-            # Extract content
-            content = self.extract_article_content(
-                article["url"], 
-                source=article.get("source"),
-                article_data=article
-            )
-            
-            if not content:
-                continue
-                
-            # For non-arXiv articles, check minimum length
-            if article.get("source") != "arXiv" and len(content.split()) < 800:
-                continue
-            
-            # Prepare article data for batch evaluation
-            article_data = {
-                "title": article["title"],
-                "content": content[:3000],  # Reduced content length for reliability
-                "source": article["source"],
-                "is_paywalled": article.get("is_paywalled", False)
-            }
-            
-            current_batch.append(article)
-            batch_data.append(article_data)
-            
-            # Process batch when it reaches batch_size
-            if len(current_batch) == batch_size:
-                print(f"Evaluating batch of {batch_size} articles...")
-                evaluations = self.batch_evaluate_articles(batch_data, batch_size)
-                
-                # Add evaluated articles to curated list
-                for idx, (eval_result, orig_article) in enumerate(zip(evaluations, current_batch)):
-                    if (eval_result.get("impact_score", 0) >= 7 and 
-                        eval_result.get("originality_score", 0) >= 6 and 
-                        eval_result.get("worth_reading", False)):
-                        curated_articles.append({
-                            "title": orig_article["title"],
-                            "url": orig_article["url"],
-                            "source": orig_article["source"],
-                            "evaluation": eval_result
-                        })
-                
-                # Reset batch
-                current_batch = []
-                batch_data = []
-                time.sleep(3)  # Additional sleep between batches
+        for article in unique_articles:
+            progress.update()
+
+            url = article["url"]
+            candidate = self.prepare_candidate(article, stored_contents.get(url), url in known_evaluations)
+            if candidate is not None:
+                candidates.append(candidate)
         
-        # Process remaining articles
-        if current_batch:
-            print(f"Evaluating final batch of {len(current_batch)} articles...")
-            evaluations = self.batch_evaluate_articles(batch_data, len(current_batch))
-            for idx, (eval_result, orig_article) in enumerate(zip(evaluations, current_batch)):
-                if (eval_result.get("impact_score", 0) >= 7 and 
-                    eval_result.get("originality_score", 0) >= 6 and 
-                    eval_result.get("worth_reading", False)):
-                    curated_articles.append({
-                        "title": orig_article["title"],
-                        "url": orig_article["url"],
-                        "source": orig_article["source"],
-                        "evaluation": eval_result
-                    })
+        progress.close()
+
+        # Only one representative per topic cluster is sent to Gemini
+        representatives, vectors = self.cluster_candidates(candidates, known_evaluations)
+
+        curated_articles = []
+        pending = []
+        for item in representatives:
+            url = item["article"]["url"]
+            if url in known_evaluations:
+                curated_articles.extend(self.select_curated([known_evaluations[url]], [item["article"]]))
+            else:
+                pending.append(item)
         
-        print(f"Final curated articles count: {len(curated_articles)}")
+        # Process articles in batches
+        for start in range(0, len(pending), self.batch_size):
+            batch = pending[start:start + self.batch_size]
+            current_batch = [item["article"] for item in batch]
+            logger.info(f"Evaluating batch of {len(batch)} articles...")
+            batch_data = [item["data"] for item in batch]
+            evaluations = self.batch_evaluate_articles(batch_data, len(batch))
+            self.record_evaluations(evaluations, current_batch, batch_data)
+            
+            # Add evaluated articles to curated list
+            curated_articles.extend(self.select_curated(evaluations, current_batch))
         
-        # Sort by combined score
-        curated_articles.sort(
-            key=lambda x: (
-                x["evaluation"]["impact_score"] + 
-                x["evaluation"]["originality_score"]
-            ), 
-            reverse=True
-        )
+        logger.info(f"Final curated articles count: {len(curated_articles)}")
         
-        return curated_articles
\ No newline at end of file
+        # Sort by combined score, then pick a topically diverse digest
+        return self.select_digest(self.rank_articles(curated_articles), vectors)
+
@@ -0,0 +1,241 @@
+# src/distributed.py
+import hashlib
+import logging
+import multiprocessing
+import os
+import socket
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional
+from .workqueue import WorkQueue, Task
+from .utils import setup_logging
+
+logger = logging.getLogger(__name__)
+
+FETCH, EXTRACT, EVALUATE = 'fetch', 'extract', 'evaluate'
+
+
+def make_task_id(run_id: str, stage: str, key: str) -> str:
+    """Deterministic task id, so re-submitting the same work is a no-op."""
+    return f"{run_id}:{stage}:{hashlib.sha1(key.encode('utf-8')).hexdigest()}"
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def handle_task(curator, queue: WorkQueue, task: Task):
+    """Run one task and return its (JSON-serialisable) result."""
+    payload = task.payload
+
+    if task.stage == FETCH:
+        extractor = curator.get_extractor(payload['source'])
+        parts = extractor.split(payload['parts']) if extractor else []
+        if payload['part'] >= len(parts):
+            return 0
+        articles = parts[payload['part']].get_cached_articles(payload['days_ago'])
+
+        # Same as in-process: skip sent articles, and don't re-extract evaluated ones
+        articles, known_evaluations = curator.apply_history(articles)
+        stored_contents = curator.history.get_contents(known_evaluations) if known_evaluations else {}
+
+        # Keyed by URL, so an article seen from several sources is only extracted once
+        queue.put_many([
+            (make_task_id(payload['run_id'], EXTRACT, article['url']), EXTRACT,
+             {"article": article, "evaluated": article['url'] in known_evaluations,
+              "content": stored_contents.get(article['url'])})
+            for article in articles
+        ])
+        return len(articles)
+
+    if task.stage == EXTRACT:
+        # Network errors and 5xx raise, so the queue retries the task with backoff
+        return curator.prepare_candidate(payload["article"], payload["content"], payload["evaluated"],
+                                         raise_transient=True)
+
+    if task.stage == EVALUATE:
+        batch_data = [item["data"] for item in payload["items"]]
+        evaluations = curator.batch_evaluate_articles(batch_data, len(batch_data))
+        if all(evaluation.get("evaluation_failed") for evaluation in evaluations):
+            # Gemini was down or unparseable; don't let the defaults count as done
+            raise RuntimeError(f"Evaluation failed for all {len(evaluations)} articles in the batch")
+        return evaluations
+
+    raise ValueError(f"Unknown task stage: {task.stage}")
+
+
+def process_next(curator, queue: WorkQueue, worker_id: str,
+                 stages: Optional[List[str]] = None, run_ids: Optional[List[str]] = None) -> bool:
+    """Lease and run a single task. Returns False if nothing was runnable."""
+    task = queue.lease(worker_id, stages, run_ids)
+    if task is None:
+        return False
+
+    try:
+        queue.complete(task, handle_task(curator, queue, task))
+    except Exception as e:
+        logger.warning(f"Task {task.task_id} failed (attempt {task.attempts}): {e}", extra={'sample_key': 'task-failed'})
+        queue.fail(task, str(e))
+    return True
+
+
+def run_worker(queue_path: str, curator_kwargs: Dict, worker_id: Optional[str] = None,
+               poll_interval: float = 2.0, configure_logging: bool = False,
+               run_id: Optional[str] = None, rate_share: Optional[int] = None):
+    """Work through queue tasks until there is nothing left to serve.
+
+    With `run_id`, serves that run until its coordinator closes it, waiting for it to
+    start if needed. Otherwise serves every open run (newest first), waits for one to
+    be opened, and exits once no run it could serve is open any more."""
+    from .curator import EnhancedArticleCurator
+
+    listener = None
+    if configure_logging:
+        # A forked child inherits the queue handler but not the parent's listener thread
+        listener = setup_logging()
+
+    worker_id = worker_id or default_worker_id()
+    queue = WorkQueue(queue_path)
+    curator = EnhancedArticleCurator(**curator_kwargs)
+    if rate_share:
+        curator.limiter.set_share(rate_share)
+
+    served = False
+    try:
+        while True:
+            if run_id is not None:
+                status = queue.run_status(run_id)
+                if status == 'closed':
+                    break
+                runs = [run_id] if status == 'open' else []
+            else:
+                runs = queue.open_runs()
+                if not runs and served:
+                    break
+
+            if runs:
+                served = True
+                if process_next(curator, queue, worker_id, run_ids=runs):
+                    continue
+            time.sleep(poll_interval)
+    finally:
+        queue.close()
+        if listener is not None:
+            # Child processes exit without running atexit handlers; flush queued records
+            listener.stop()
+
+
+def wait_for_stages(curator, queue: WorkQueue, run_id: str, stages: List[str],
+                    poll_interval: float = 2.0):
+    """Block until every task of the given stages is done or failed, helping out meanwhile."""
+    worker_id = f"{default_worker_id()}-coordinator"
+    while True:
+        outstanding = queue.outstanding(stages, prefix=f"{run_id}:")
+        if not outstanding:
+            break
+        logger.info(f"{'/'.join(stages)} tasks outstanding: {outstanding}",
+                    extra={'sample_key': 'queue-progress', 'outstanding': outstanding})
+        if not process_next(curator, queue, worker_id, stages, [run_id]):
+            time.sleep(poll_interval)
+
+
+def curate_distributed(curator, days_ago: int, queue_path: str, workers: int,
+                       run_id: Optional[str] = None, poll_interval: float = 2.0) -> List[Dict]:
+    """Coordinate a curation run over the work queue and merge the ranked results.
+
+    Task ids are keyed by run_id. Without one a fresh run is started; passing the
+    run_id of an interrupted run resumes it and reuses its finished work."""
+    run_id = run_id or f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{days_ago}d-{uuid.uuid4().hex[:6]}"
+    prefix = f"{run_id}:"
+    queue = WorkQueue(queue_path)
+    queue.open_run(run_id)
+
+    # One fetch task per source shard, split the same way the in-process scheduler does
+    fetch_tasks = []
+    for source in curator.sources:
+        extractor = curator.get_extractor(source)
+        if extractor is None:
+            continue
+        parts = len(extractor.split(extractor.concurrency))
+        for part in range(parts):
+            payload = {'run_id': run_id, 'source': source, 'part': part, 'parts': extractor.concurrency,
+                       'days_ago': days_ago}
+            fetch_tasks.append((make_task_id(run_id, FETCH, f"{source}/{part}"), FETCH, payload))
+    queue.put_many(fetch_tasks)
+    logger.info(f"Queued {len(fetch_tasks)} fetch tasks for run {run_id} (pass --run-id {run_id} to resume it)")
+
+    # The coordinator works on tasks too, so rates are split between workers + 1 processes
+    rate_share = curator.rate_share if curator.rate_share > 1 else workers + 1
+    curator.limiter.set_share(rate_share)
+
+    processes = []
+    for i in range(workers):
+        process = multiprocessing.Process(
+            target=run_worker,
+            args=(queue_path, curator.init_kwargs),
+            kwargs={'worker_id': f"{default_worker_id()}-w{i}", 'poll_interval': poll_interval,
+                    'configure_logging': logging.getLogger().hasHandlers(), 'run_id': run_id,
+                    'rate_share': rate_share}
+        )
+        process.start()
+        processes.append(process)
+
+    try:
+        wait_for_stages(curator, queue, run_id, [FETCH, EXTRACT], poll_interval)
+
+        prepared = [item for item in queue.results(EXTRACT, prefix).values() if item]
+
+        # Look up stored evaluations; this also re-checks sent articles against the
+        # coordinator's history, since workers on other nodes may have their own
+        articles, known_evaluations = curator.apply_history([item["article"] for item in prepared])
+        remaining = {article["url"] for article in articles}
+        candidates = [item for item in prepared if item["article"]["url"] in remaining]
+
+        # Only one representative per topic cluster is evaluated
+        representatives, vectors = curator.cluster_candidates(candidates, known_evaluations)
+        known = [item for item in representatives if item["article"]["url"] in known_evaluations]
+        prepared = [item for item in representatives
+                    if item["article"]["url"] not in known_evaluations and item["data"]]
+        pending_urls = {item["article"]["url"] for item in prepared}
+        logger.info(f"Articles ready for evaluation: {len(prepared)} ({len(known)} already evaluated)")
+
+        # Batches are keyed by their URLs, so a resumed run finds its finished evaluations
+        evaluate_tasks = []
+        for start in range(0, len(prepared), curator.batch_size):
+            items = prepared[start:start + curator.batch_size]
+            key = "\n".join(item["article"]["url"] for item in items)
+            evaluate_tasks.append((make_task_id(run_id, EVALUATE, key), EVALUATE, {"items": items}))
+        queue.put_many(evaluate_tasks)
+
+        wait_for_stages(curator, queue, run_id, [EVALUATE], poll_interval)
+    finally:
+        queue.close_run(run_id)
+        for process in processes:
+            process.join()
+
+    curated_articles = curator.select_curated(
+        [known_evaluations[item["article"]["url"]] for item in known],
+        [item["article"] for item in known]
+    )
+    for task_id, evaluations in queue.results(EVALUATE, prefix).items():
+        items = queue.get_payload(task_id)["items"]
+        if len(evaluations) != len(items):
+            logger.warning(f"Skipping {task_id}: {len(evaluations)} evaluations for {len(items)} articles")
+            continue
+        # A resumed run may already have these in the history (and so in `known`)
+        fresh = [(evaluation, item["article"], item["data"]) for evaluation, item in zip(evaluations, items)
+                 if item["article"]["url"] in pending_urls]
+        if not fresh:
+            continue
+        evaluations, articles, articles_data = [list(group) for group in zip(*fresh)]
+        curator.record_evaluations(evaluations, articles, articles_data)
+        curated_articles.extend(curator.select_curated(evaluations, articles))
+
+    failed = queue.failed(prefix)
+    if failed:
+        logger.warning(f"{failed} tasks failed permanently in run {run_id}")
+    queue.close()
+
+    logger.info(f"Final curated articles count: {len(curated_articles)}")
+    return curator.select_digest(curator.rank_articles(curated_articles), vectors)
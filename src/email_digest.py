@@ -1,10 +1,13 @@
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import smtplib
+import logging
 from typing import List, Dict
 import markdown
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 class EmailDigest:
     def __init__(self, smtp_config: Dict):
         self.smtp_config = smtp_config
@@ -28,6 +31,16 @@ class EmailDigest:
         # Add each article
         for idx, article in enumerate(articles, 1):
             eval_data = article['evaluation']
+
+            # Other articles on the same topic that were folded into this one
+            related_html = ""
+            if article.get('related'):
+                links = ", ".join(f'<a href="{item["url"]}">{item["title"]}</a> ({item["source"]})'
+                                  for item in article['related'])
+                related_html = f"""
+                <div style="margin-top: 10px; color: #666; font-size: 14px;">
+                    <strong>Also covered by:</strong> {links}
+                </div>"""
             html += f"""
             <div style="margin-bottom: 30px; padding: 20px; border: 1px solid #eee; border-radius: 5px;">
                 <div style="color: #2c5282; font-size: 20px; margin-bottom: 10px;">
@@ -53,7 +66,7 @@ class EmailDigest:
                 </div>
                 <div>
                     <strong>Time Value:</strong> {eval_data['time_value_assessment']}
-                </div>
+                </div>{related_html}
             </div>
             """
 
@@ -97,8 +110,8 @@ class EmailDigest:
             with smtplib.SMTP_SSL(self.smtp_config['server'], self.smtp_config['port']) as server:
                 server.login(self.smtp_config['username'], self.smtp_config['password'])
                 server.send_message(msg)
-                print("Email sent successfully!")
+                logger.info("Email sent successfully!")
             return True
         except Exception as e:
-            print(f"Error sending email: {e}")
+            logger.error(f"Error sending email: {e}")
             return False
\ No newline at end of file
@@ -1,6 +1,20 @@
-from .rss import RSSExtractor
-from .reddit import RedditExtractor
-from .arxiv import ArxivExtractor
-from .hackernews import HackerNewsExtractor
+from .registry import EXTRACTOR_REGISTRY, register_extractor, get_extractor_class
+from .base import BaseExtractor
 
-__all__ = ['RSSExtractor', 'RedditExtractor', 'ArxivExtractor', 'HackerNewsExtractor']
\ No newline at end of file
+_CLASS_TO_SOURCE = {
+    'RSSExtractor': 'rss',
+    'RedditExtractor': 'reddit',
+    'ArxivExtractor': 'arxiv',
+    'HackerNewsExtractor': 'hackernews',
+}
+
+
+def __getattr__(name: str):
+    # Keep `from src.extractors import RSSExtractor` working without eager imports
+    if name in _CLASS_TO_SOURCE:
+        return get_extractor_class(_CLASS_TO_SOURCE[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ['RSSExtractor', 'RedditExtractor', 'ArxivExtractor', 'HackerNewsExtractor',
+           'BaseExtractor', 'EXTRACTOR_REGISTRY', 'register_extractor', 'get_extractor_class']
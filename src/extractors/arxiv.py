@@ -2,13 +2,31 @@
 import arxiv
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict
+import copy
+import logging
 from .base import BaseExtractor
 
+logger = logging.getLogger(__name__)
+
 class ArxivExtractor(BaseExtractor):
+    source_type = 'arxiv'
+    concurrency = 1
+    request_delay = 3.0  # arXiv asks for a few seconds between API calls
+    cache_ttl = 3600
+    cost = 5.0
+
     def __init__(self, categories: List[str]):
         super().__init__()
         self.categories = categories
 
+    def get_units(self) -> List[str]:
+        return list(self.categories)
+
+    def with_units(self, units: List[str]) -> 'ArxivExtractor':
+        part = copy.copy(self)
+        part.categories = list(units)
+        return part
+
     def get_articles(self, days_ago: int = 7) -> List[Dict]:
         articles = []
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_ago)
@@ -21,6 +39,7 @@ class ArxivExtractor(BaseExtractor):
         )
 
         try:
+            self.rate_limit()
             for result in search.results():
                 if result.published > cutoff_date:
                     # Instead of PDF URL, use the abstract page URL
@@ -38,6 +57,6 @@ class ArxivExtractor(BaseExtractor):
                         "content": f"""Title: {result.title}\n\nAuthors: {', '.join(author.name for author in result.authors)}\n\nAbstract: {result.summary}\n\nCategory: {result.primary_category}\n\nPublished: {result.published.strftime('%Y-%m-%d')}"""
                     })
         except Exception as e:
-            print(f"Error fetching from arXiv: {e}")
+            logger.error(f"Error fetching from arXiv: {e}")
 
         return articles
\ No newline at end of file
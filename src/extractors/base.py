@@ -1,21 +1,104 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict
-from datetime import datetime
-import time
+from typing import List, Dict, Optional, Any
+import copy
+import json
+import zlib
+from .registry import register_extractor
+from ..rate_limiter import get_rate_limiter
 
 class BaseExtractor(ABC):
+    # Registry key; subclasses that set it are registered automatically on import
+    source_type: Optional[str] = None
+
+    # Scheduling policy, overridable per source from config
+    concurrency: int = 1        # shards of this source that may run in parallel
+    request_delay: float = 1.0  # seconds between requests at full speed (shared limiter rate)
+    cache_ttl: float = 0        # seconds a fetched listing may be reused (needs a listing_cache)
+    cost: float = 1.0           # relative cost of fetching one unit (feed, subreddit, ...)
+
+    POLICY_KEYS = ('concurrency', 'request_delay', 'cache_ttl', 'cost')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.__dict__.get('source_type'):
+            register_extractor(cls.source_type, cls)
+
     def __init__(self):
-        self.last_request_time = datetime.now()
+        self.limiter = get_rate_limiter()
+        # Set by the curator: configured source name and a persistent store for listings
+        self.source_name: Optional[str] = None
+        self.listing_cache = None
+
+    def rate_limit(self, delay: Optional[float] = None, key: Optional[str] = None):
+        """Wait for the shared limiter before a request to `key` (default: this source).
+
+        `delay` sets the key's rate the first time it is seen; 429s reported through
+        the limiter slow every shard and thread using the same key."""
+        if delay is None:
+            delay = self.request_delay
+        if delay <= 0:
+            return
+        self.limiter.acquire(key or self.source_type or type(self).__name__, rate=1.0 / delay)
+
+    def apply_policy(self, policy: Dict[str, Any]):
+        """Override policy attributes on this instance (e.g. from config)."""
+        for key in self.POLICY_KEYS:
+            if key in policy:
+                setattr(self, key, policy[key])
+
+    def get_units(self) -> List[str]:
+        """Independent units of work this source can be split into."""
+        return [self.source_type or type(self).__name__]
+
+    def with_units(self, units: List[str]) -> 'BaseExtractor':
+        """Copy of this extractor restricted to the given units."""
+        return copy.copy(self)
+
+    def estimated_cost(self) -> float:
+        """Declared cost of one get_articles call, used to order scheduling."""
+        return self.cost * len(self.get_units())
+
+    def shard(self, index: int, count: int) -> Optional['BaseExtractor']:
+        """Deterministic slice of this source for shard `index` of `count`, or None if empty.
+
+        Units are dealt round-robin, offset by a stable hash of the source so single-unit
+        sources don't all land on shard 0."""
+        if count <= 1:
+            return self
+        units = self.get_units()
+        offset = zlib.crc32(str(self.source_type or type(self).__name__).encode())
+        mine = [unit for i, unit in enumerate(units) if (i + offset) % count == index]
+        if not mine:
+            return None
+        if len(mine) == len(units):
+            return self
+        return self.with_units(mine)
+
+    def split(self, parts: int) -> List['BaseExtractor']:
+        """Split into at most `parts` non-empty shards."""
+        shards = (self.shard(i, parts) for i in range(max(parts, 1)))
+        return [shard for shard in shards if shard is not None]
+
+    def cache_key(self) -> List[str]:
+        """What this extractor fetches, for keying cached listings (default: its units)."""
+        return self.get_units()
+
+    def get_cached_articles(self, days_ago: int = 7) -> List[Dict]:
+        """get_articles, reusing a listing fetched within cache_ttl by this or an earlier run."""
+        if not self.cache_ttl or self.listing_cache is None:
+            return self.get_articles(days_ago)
+
+        key = json.dumps([self.source_name or self.source_type or type(self).__name__,
+                          self.cache_key(), days_ago])
+        cached = self.listing_cache.get_listing(key, self.cache_ttl)
+        if cached is not None:
+            return cached
 
-    def rate_limit(self, delay: float = 1.0):
-        """Basic rate limiting."""
-        now = datetime.now()
-        time_passed = (now - self.last_request_time).total_seconds()
-        if time_passed < delay:
-            time.sleep(delay - time_passed)
-        self.last_request_time = now
+        articles = self.get_articles(days_ago)
+        self.listing_cache.put_listing(key, articles)
+        return articles
 
     @abstractmethod
     def get_articles(self, days_ago: int = 7) -> List[Dict]:
         """Get articles from the source."""
-        pass
\ No newline at end of file
+        pass
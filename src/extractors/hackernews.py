@@ -2,9 +2,18 @@ from hn import HN as HackerNews
 from datetime import datetime, timedelta
 from typing import List, Dict
 import time
+import logging
 from .base import BaseExtractor
 
+logger = logging.getLogger(__name__)
+
 class HackerNewsExtractor(BaseExtractor):
+    source_type = 'hackernews'
+    concurrency = 1
+    request_delay = 0.5  # HN API rate limiting
+    cache_ttl = 1800
+    cost = 50.0  # walks ~100 stories one request at a time
+
     def __init__(self, min_score: int = 100):
         super().__init__()
         self.hn = HackerNews()
@@ -17,7 +26,7 @@ class HackerNewsExtractor(BaseExtractor):
         try:
             # Get top stories from HN
             for story in self.hn.get_stories(story_type='top', limit=100):
-                self.rate_limit(0.5)  # HN API rate limiting
+                self.rate_limit()
                 
                 if (story.submission_time > cutoff_time and 
                     hasattr(story, 'url') and 
@@ -32,6 +41,6 @@ class HackerNewsExtractor(BaseExtractor):
                         "comment_count": story.num_comments
                     })
         except Exception as e:
-            print(f"Error fetching from HackerNews: {e}")
+            logger.error(f"Error fetching from HackerNews: {e}")
 
         return articles
\ No newline at end of file
@@ -1,17 +1,44 @@
-import praw
 from datetime import datetime, timedelta
 from typing import List, Dict
+import copy
+import logging
 from .base import BaseExtractor
 
+logger = logging.getLogger(__name__)
+
 class RedditExtractor(BaseExtractor):
+    source_type = 'reddit'
+    concurrency = 2
+    request_delay = 1.0
+    cache_ttl = 3600
+    cost = 2.0
+
     def __init__(self, client_id: str, client_secret: str, subreddits: List[str]):
         super().__init__()
-        self.reddit = praw.Reddit(
-            client_id=client_id,
-            client_secret=client_secret,
-            user_agent="ArticleCurator/1.0"
-        )
+        self.client_id = client_id
+        self.client_secret = client_secret
         self.subreddits = subreddits
+        self._reddit = None
+
+    @property
+    def reddit(self):
+        """PRAW client, created on first use."""
+        if self._reddit is None:
+            import praw
+            self._reddit = praw.Reddit(
+                client_id=self.client_id,
+                client_secret=self.client_secret,
+                user_agent="ArticleCurator/1.0"
+            )
+        return self._reddit
+
+    def get_units(self) -> List[str]:
+        return list(self.subreddits)
+
+    def with_units(self, units: List[str]) -> 'RedditExtractor':
+        part = copy.copy(self)
+        part.subreddits = list(units)
+        return part
 
     def get_articles(self, days_ago: int = 7) -> List[Dict]:
         articles = []
@@ -31,6 +58,6 @@ class RedditExtractor(BaseExtractor):
                             "upvote_ratio": post.upvote_ratio
                         })
             except Exception as e:
-                print(f"Error fetching from r/{subreddit_name}: {e}")
+                logger.error(f"Error fetching from r/{subreddit_name}: {e}")
 
         return articles
\ No newline at end of file
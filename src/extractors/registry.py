@@ -0,0 +1,31 @@
+# src/extractors/registry.py
+import importlib
+from typing import Dict, Type, Union
+
+# Source type -> extractor class, or a "module:Class" path that is imported on first use
+# (relative paths resolve against this package).
+# Built-in sources are registered as paths so their client libraries stay unloaded until needed.
+EXTRACTOR_REGISTRY: Dict[str, Union[str, Type]] = {
+    'rss': '.rss:RSSExtractor',
+    'reddit': '.reddit:RedditExtractor',
+    'arxiv': '.arxiv:ArxivExtractor',
+    'hackernews': '.hackernews:HackerNewsExtractor',
+}
+
+
+def register_extractor(source_type: str, extractor: Union[str, Type]):
+    """Register an extractor class (or a lazy "module:Class" path) under a source type."""
+    EXTRACTOR_REGISTRY[source_type] = extractor
+
+
+def get_extractor_class(source_type: str) -> Type:
+    """Import and return the extractor class registered for a source type."""
+    if source_type not in EXTRACTOR_REGISTRY:
+        raise ValueError(f"Unknown source: {source_type}")
+
+    extractor = EXTRACTOR_REGISTRY[source_type]
+    if isinstance(extractor, str):
+        module_name, class_name = extractor.split(':')
+        extractor = getattr(importlib.import_module(module_name, __package__), class_name)
+        EXTRACTOR_REGISTRY[source_type] = extractor
+    return extractor
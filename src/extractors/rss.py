@@ -1,17 +1,115 @@
 # src/extractors/rss.py
 import feedparser
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict
-import time
+from typing import List, Dict, Optional, Tuple
+import copy
+import logging
+import multiprocessing
+import os
+import threading
 from .base import BaseExtractor
+from ..rate_limiter import backoff_delay, host_key
 import requests
+import time
 from urllib.parse import urlparse
 
+logger = logging.getLogger(__name__)
+
+# Known paywall domains, matched against the host and each of its parent domains
+PAYWALL_DOMAINS = frozenset({
+    'nature.com',
+    'science.org',
+    'sciencemag.org',
+    'cell.com',
+    'nejm.org',
+    'ieee.org'
+})
+
+# (title, link, published_date, description, is_paywalled)
+EntryTuple = Tuple[str, str, str, str, bool]
+
+PAYWALL_NOTICE = "[This article is from a paywalled source. Full content may not be accessible.]"
+
+# One parse pool per process, shared by every RSS extractor and shard
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_pid: Optional[int] = None
+_parse_pool_lock = threading.Lock()
+
+
+def is_paywall_url(url: str) -> bool:
+    """Check the host and its parent domains against the paywall index."""
+    host = urlparse(url).netloc.lower().split(':')[0]
+    while host:
+        if host in PAYWALL_DOMAINS:
+            return True
+        _, _, host = host.partition('.')
+    return False
+
+
+def parse_entry_date(entry) -> datetime:
+    """Parse publication date from feed entry."""
+    parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+    if parsed:
+        return datetime(*parsed[:6])
+    return datetime.now()
+
+
+def parse_feed(feed_text: str, cutoff_date: datetime) -> List[EntryTuple]:
+    """Parse a feed and return compact tuples for entries newer than the cutoff.
+
+    Runs in a worker process, so it only returns plain picklable values."""
+    feed = feedparser.parse(feed_text)
+    entries = []
+
+    for entry in feed.entries:
+        link = entry.get('link')
+        if not link:
+            continue
+
+        pub_date = parse_entry_date(entry)
+        if pub_date <= cutoff_date:
+            continue
+
+        # Extract description and handle potential paywall
+        is_paywalled = is_paywall_url(link)
+        description = entry.get('summary', '')
+        if len(description) < 100 and is_paywalled:
+            description = PAYWALL_NOTICE
+
+        entries.append((entry.get('title', ''), link, pub_date.isoformat(), description, is_paywalled))
+
+    return entries
+
+
+def get_parse_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Process pool for feed parsing, created once per process.
+
+    Workers are spawned rather than forked: extractors run on scheduler threads (and
+    logging has a listener thread), and forking a multithreaded process can deadlock.
+    `max_workers` only applies when the pool is first created."""
+    global _parse_pool, _parse_pool_pid
+    with _parse_pool_lock:
+        # A forked queue worker inherits the object but not the parent's pool processes
+        if _parse_pool is None or _parse_pool_pid != os.getpid():
+            _parse_pool = ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 1,
+                                              mp_context=multiprocessing.get_context('spawn'))
+            _parse_pool_pid = os.getpid()
+        return _parse_pool
+
+
 class RSSExtractor(BaseExtractor):
-    def __init__(self, feeds_config: Dict[str, str]):
+    source_type = 'rss'
+    concurrency = 4
+    request_delay = 1.0
+    cache_ttl = 3600
+    cost = 1.0
+
+    def __init__(self, feeds_config: Dict[str, str], max_workers: Optional[int] = None):
         super().__init__()
         self.feeds = feeds_config
-        
+        self.max_workers = max_workers  # size of the shared parse pool, if this creates it
+
         # Configure headers to mimic a browser
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
@@ -21,58 +119,68 @@ class RSSExtractor(BaseExtractor):
             'Upgrade-Insecure-Requests': '1',
         }
 
+    def get_units(self) -> List[str]:
+        return list(self.feeds)
+
+    def cache_key(self) -> List[str]:
+        # Feed names are only unique within one source; the URLs identify the listing
+        return [self.feeds[source] for source in self.get_units()]
+
+    def with_units(self, units: List[str]) -> 'RSSExtractor':
+        part = copy.copy(self)
+        part.feeds = {source: self.feeds[source] for source in units}
+        return part
+
     def parse_date(self, entry) -> datetime:
         """Parse publication date from feed entry."""
-        if hasattr(entry, 'published_parsed'):
-            return datetime(*entry.published_parsed[:6])
-        elif hasattr(entry, 'updated_parsed'):
-            return datetime(*entry.updated_parsed[:6])
-        return datetime.now()
+        return parse_entry_date(entry)
 
     def is_paywall_site(self, url: str) -> bool:
         """Check if the URL is from a known paywall site."""
-        paywall_domains = {
-            'nature.com',
-            'science.org',
-            'sciencemag.org',
-            'cell.com',
-            'nejm.org',
-            'ieee.org'
-        }
-        domain = urlparse(url).netloc.lower()
-        return any(pd in domain for pd in paywall_domains)
+        return is_paywall_url(url)
+
+    def fetch_feed(self, feed_url: str, max_retries: int = 3) -> str:
+        """Download a feed through the shared per-host limiter, honouring 429/Retry-After."""
+        key = host_key(feed_url)
+        for attempt in range(max_retries):
+            self.rate_limit(key=key)
+
+            # Use headers for feed fetching
+            response = requests.get(feed_url, headers=self.headers, timeout=10)
+            if not self.limiter.report(key, response.status_code, response.headers):
+                return response.text
+            if attempt < max_retries - 1:
+                time.sleep(backoff_delay(attempt))
+        response.raise_for_status()
+        return response.text
 
     def get_articles(self, days_ago: int = 7) -> List[Dict]:
         articles = []
         cutoff_date = datetime.now() - timedelta(days=days_ago)
 
+        # Feeds are downloaded here while parsing happens in the shared worker processes
+        pool = get_parse_pool(self.max_workers)
+        pending = []
         for source, feed_url in self.feeds.items():
             try:
-                self.rate_limit()
-                
-                # Use headers for feed fetching
-                response = requests.get(feed_url, headers=self.headers, timeout=10)
-                feed = feedparser.parse(response.text)
-                
-                for entry in feed.entries:
-                    pub_date = self.parse_date(entry)
-                    
-                    if pub_date > cutoff_date:
-                        # Extract description and handle potential paywall
-                        description = entry.get('summary', '')
-                        if len(description) < 100 and self.is_paywall_site(entry.link):
-                            description = "[This article is from a paywalled source. Full content may not be accessible.]"
-                        
-                        articles.append({
-                            "title": entry.title,
-                            "url": entry.link,
-                            "source": source,
-                            "published_date": pub_date.isoformat(),
-                            "description": description,
-                            "is_paywalled": self.is_paywall_site(entry.link)
-                        })
+                feed_text = self.fetch_feed(feed_url)
+                pending.append((source, pool.submit(parse_feed, feed_text, cutoff_date)))
             except Exception as e:
-                print(f"Error fetching {source} feed: {e}")
+                logger.error(f"Error fetching {source} feed: {e}")
                 continue
 
-        return articles
\ No newline at end of file
+        for source, future in pending:
+            try:
+                for title, link, published_date, description, is_paywalled in future.result():
+                    articles.append({
+                        "title": title,
+                        "url": link,
+                        "source": source,
+                        "published_date": published_date,
+                        "description": description,
+                        "is_paywalled": is_paywalled
+                    })
+            except Exception as e:
+                logger.error(f"Error parsing {source} feed: {e}")
+
+        return articles
@@ -0,0 +1,173 @@
+# src/fetcher.py
+import logging
+import time
+import zlib
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+import requests
+from .rate_limiter import get_rate_limiter, backoff_delay, host_key
+
+logger = logging.getLogger(__name__)
+
+
+class TransientFetchError(Exception):
+    """A fetch failed in a way that may succeed later (network error, 5xx, throttling)."""
+
+class ContentFetcher:
+    """Streams article pages with a byte cap instead of buffering whole responses."""
+
+    DEFAULT_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml;q=0.9,*/*;q=0.1',
+        'Accept-Language': 'en-US,en;q=0.5',
+        # Only encodings we can inflate incrementally ourselves
+        'Accept-Encoding': 'gzip, deflate',
+    }
+
+    HTML_CONTENT_TYPES = {'text/html', 'application/xhtml+xml', 'text/plain'}
+
+    # Paths we know are not worth downloading at all
+    SKIP_EXTENSIONS = (
+        '.pdf', '.zip', '.gz', '.tar', '.mp3', '.mp4', '.mov', '.avi',
+        '.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.epub',
+        '.doc', '.docx', '.ppt', '.pptx', '.xls', '.xlsx',
+    )
+
+    def __init__(self, max_bytes: int = 2 * 1024 * 1024, timeout: float = 15.0,
+                 chunk_size: int = 16 * 1024, probe_first: bool = False,
+                 headers: Optional[Dict[str, str]] = None,
+                 host_rate: float = 1.0, max_retries: int = 3):
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.probe_first = probe_first
+        self.host_rate = host_rate  # requests per second to any one host
+        self.max_retries = max_retries
+        self.limiter = get_rate_limiter()
+        self.session = requests.Session()
+        self.session.headers.update(headers or self.DEFAULT_HEADERS)
+
+    def is_skippable_url(self, url: str) -> bool:
+        """Check if the URL obviously points at non-HTML content."""
+        path = urlparse(url).path.lower()
+        if path.startswith('/pdf/'):  # arXiv style PDF links
+            return True
+        return path.endswith(self.SKIP_EXTENSIONS)
+
+    def is_html_response(self, headers) -> bool:
+        """Check the Content-Type header; a missing header is given the benefit of the doubt."""
+        content_type = headers.get('Content-Type', '')
+        if not content_type:
+            return True
+        return content_type.split(';')[0].strip().lower() in self.HTML_CONTENT_TYPES
+
+    def probe(self, url: str) -> Tuple[bool, Optional[int]]:
+        """HEAD the URL (falling back to a one-byte range GET) to check type and size.
+
+        Returns (is_html, content_length)."""
+        try:
+            self.limiter.acquire(host_key(url), rate=self.host_rate)
+            response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+            if response.status_code >= 400:
+                # Plenty of servers reject HEAD; ask for the first byte instead
+                response = self.session.get(url, timeout=self.timeout, stream=True,
+                                            headers={'Range': 'bytes=0-0'})
+                response.close()
+            if response.status_code >= 400:
+                return False, None
+
+            length = None
+            content_range = response.headers.get('Content-Range', '')
+            if '/' in content_range and content_range.rsplit('/', 1)[1].isdigit():
+                length = int(content_range.rsplit('/', 1)[1])
+            elif response.headers.get('Content-Length', '').isdigit() and response.status_code != 206:
+                length = int(response.headers['Content-Length'])
+            return self.is_html_response(response.headers), length
+        except requests.RequestException as e:
+            logger.warning(f"Error probing {url}: {e}", extra={'sample_key': 'fetch-error'})
+            return False, None
+
+    def _decompressor(self, encoding: str):
+        encoding = encoding.strip().lower()
+        if encoding in ('gzip', 'x-gzip'):
+            return zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if encoding == 'deflate':
+            # Most servers send zlib-wrapped deflate; the raw variant is handled on the first chunk
+            return zlib.decompressobj(zlib.MAX_WBITS)
+        return None
+
+    def _read_capped(self, response) -> bytes:
+        """Read at most max_bytes of decoded body, inflating chunk by chunk."""
+        encoding = response.headers.get('Content-Encoding', '')
+        decompressor = self._decompressor(encoding)
+        if decompressor is None and encoding.strip().lower() not in ('', 'identity'):
+            # e.g. brotli despite our Accept-Encoding; nothing usable to read
+            return b""
+        body = bytearray()
+        first_chunk = True
+
+        for chunk in response.raw.stream(self.chunk_size, decode_content=False):
+            if decompressor is not None:
+                remaining = self.max_bytes - len(body)
+                try:
+                    chunk = decompressor.decompress(chunk, remaining)
+                except zlib.error:
+                    if not (first_chunk and encoding.strip().lower() == 'deflate'):
+                        raise
+                    decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+                    chunk = decompressor.decompress(chunk, remaining)
+            first_chunk = False
+            body.extend(chunk)
+            if len(body) >= self.max_bytes:
+                del body[self.max_bytes:]
+                break
+
+        return bytes(body)
+
+    def fetch(self, url: str, raise_transient: bool = False) -> bytes:
+        """Download an HTML page, returning b"" for content we cannot use.
+
+        The body is returned undecoded so trafilatura can detect the encoding itself
+        (HTTP header, <meta charset> or content sniffing). With `raise_transient`,
+        failures worth retrying later raise TransientFetchError instead."""
+        if self.is_skippable_url(url):
+            return b""
+
+        if self.probe_first:
+            is_html, length = self.probe(url)
+            if not is_html:
+                return b""
+            if length is not None and length > self.max_bytes:
+                logger.info(f"Skipping {url}: {length} bytes exceeds the {self.max_bytes} byte cap",
+                            extra={'sample_key': 'fetch-too-large'})
+                return b""
+
+        key = host_key(url)
+        try:
+            for attempt in range(self.max_retries):
+                self.limiter.acquire(key, rate=self.host_rate)
+                with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                    if self.limiter.report(key, response.status_code, response.headers):
+                        # Throttled: the limiter now pauses this host for Retry-After
+                        time.sleep(backoff_delay(attempt))
+                        continue
+                    if response.status_code >= 500:
+                        error = f"HTTP {response.status_code}"
+                        break
+                    if response.status_code >= 400:
+                        return b""
+                    if not self.is_html_response(response.headers):
+                        return b""
+                    return self._read_capped(response)
+            else:
+                error = "still throttled after retries"
+        except requests.RequestException as e:
+            error = str(e)
+        except zlib.error as e:
+            logger.warning(f"Error fetching {url}: {e}", extra={'sample_key': 'fetch-error'})
+            return b""
+
+        logger.warning(f"Error fetching {url}: {error}", extra={'sample_key': 'fetch-error'})
+        if raise_transient:
+            raise TransientFetchError(f"{url}: {error}")
+        return b""
@@ -0,0 +1,201 @@
+# src/history.py
+import json
+import sqlite3
+import time
+from contextlib import closing
+from typing import Dict, Iterable, List, Optional, Set
+
+class EvaluationHistory:
+    """Persistent, indexed store of every Gemini evaluation across runs.
+
+    Lets a run reuse earlier evaluations instead of paying for them again, skip
+    articles that were already sent, and answer queries like "best of the month".
+    Articles that were only sent (listed as related coverage) have a row without an
+    evaluation. Source listings are cached here too, so cache_ttl spans runs."""
+
+    def __init__(self, path: str = 'curator_history.db'):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS evaluations (
+                url TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                source TEXT,
+                category TEXT,
+                published_date TEXT,
+                evaluated_at REAL,
+                impact_score REAL,
+                originality_score REAL,
+                combined_score REAL,
+                worth_reading INTEGER,
+                evaluation TEXT,
+                content TEXT,
+                sent_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_eval_time_score ON evaluations (evaluated_at, combined_score);
+            CREATE INDEX IF NOT EXISTS idx_eval_source ON evaluations (source, evaluated_at);
+            CREATE INDEX IF NOT EXISTS idx_eval_category ON evaluations (category, evaluated_at);
+            CREATE INDEX IF NOT EXISTS idx_eval_sent ON evaluations (sent_at);
+            CREATE TABLE IF NOT EXISTS listings (
+                key TEXT PRIMARY KEY,
+                fetched_at REAL NOT NULL,
+                articles TEXT NOT NULL
+            );
+        """)
+
+    def close(self):
+        self.conn.close()
+
+    def record(self, article: Dict, evaluation: Dict, content: Optional[str] = None,
+               evaluated_at: Optional[float] = None):
+        """Store (or replace) the evaluation for an article."""
+        self.record_many([(article, evaluation, content)], evaluated_at)
+
+    def record_many(self, items: Iterable[tuple], evaluated_at: Optional[float] = None):
+        """Store (article, evaluation, content) triples in one transaction, keeping any sent_at mark.
+
+        `content` is the condensed text that was evaluated; later runs embed it to cluster
+        the article with new candidates without extracting it again."""
+        evaluated_at = evaluated_at or time.time()
+        rows = []
+        for article, evaluation, content in items:
+            impact = evaluation.get("impact_score", 0)
+            originality = evaluation.get("originality_score", 0)
+            rows.append((
+                article["url"], article["title"], article.get("source"), article.get("category"),
+                article.get("published_date"), evaluated_at, impact, originality,
+                impact + originality, int(bool(evaluation.get("worth_reading", False))),
+                json.dumps(evaluation), content
+            ))
+        with self.conn:
+            self.conn.executemany("""
+                INSERT INTO evaluations (url, title, source, category, published_date, evaluated_at,
+                                         impact_score, originality_score, combined_score,
+                                         worth_reading, evaluation, content)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    title = excluded.title, source = excluded.source, category = excluded.category,
+                    published_date = excluded.published_date, evaluated_at = excluded.evaluated_at,
+                    impact_score = excluded.impact_score, originality_score = excluded.originality_score,
+                    combined_score = excluded.combined_score, worth_reading = excluded.worth_reading,
+                    evaluation = excluded.evaluation,
+                    content = COALESCE(excluded.content, content)
+            """, rows)
+
+    def get_listing(self, key: str, max_age: float) -> Optional[List[Dict]]:
+        """Cached source listing if it was fetched less than `max_age` seconds ago.
+
+        Uses its own connection: extractors call this from scheduler threads."""
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+            row = conn.execute(
+                "SELECT articles FROM listings WHERE key = ? AND fetched_at > ?",
+                (key, time.time() - max_age)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_listing(self, key: str, articles: List[Dict]):
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO listings (key, fetched_at, articles) VALUES (?, ?, ?)",
+                (key, time.time(), json.dumps(articles))
+            )
+
+    def _chunks(self, urls: List[str], size: int = 500):
+        for start in range(0, len(urls), size):
+            yield urls[start:start + size]
+
+    def get_evaluations(self, urls: Iterable[str]) -> Dict[str, Dict]:
+        """Stored evaluations for the given URLs, keyed by URL."""
+        found = {}
+        for chunk in self._chunks(list(urls)):
+            rows = self.conn.execute(
+                f"SELECT url, evaluation FROM evaluations WHERE evaluation IS NOT NULL "
+                f"AND url IN ({','.join('?' for _ in chunk)})",
+                chunk
+            )
+            found.update((url, json.loads(evaluation)) for url, evaluation in rows)
+        return found
+
+    def get_contents(self, urls: Iterable[str]) -> Dict[str, str]:
+        """Stored condensed text for the given URLs, where there is any."""
+        found = {}
+        for chunk in self._chunks(list(urls)):
+            rows = self.conn.execute(
+                f"SELECT url, content FROM evaluations WHERE content IS NOT NULL "
+                f"AND url IN ({','.join('?' for _ in chunk)})",
+                chunk
+            )
+            found.update(rows)
+        return found
+
+    def sent_urls(self, urls: Iterable[str]) -> Set[str]:
+        """Which of the given URLs already went out in a digest."""
+        sent = set()
+        for chunk in self._chunks(list(urls)):
+            rows = self.conn.execute(
+                f"SELECT url FROM evaluations WHERE sent_at IS NOT NULL "
+                f"AND url IN ({','.join('?' for _ in chunk)})",
+                chunk
+            )
+            sent.update(url for (url,) in rows)
+        return sent
+
+    def mark_sent(self, articles: Iterable[Dict], sent_at: Optional[float] = None):
+        """Mark articles (dicts with url, title, source) as sent, adding rows for unevaluated ones."""
+        sent_at = sent_at or time.time()
+        with self.conn:
+            self.conn.executemany("""
+                INSERT INTO evaluations (url, title, source, sent_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET sent_at = excluded.sent_at
+            """, [(article["url"], article["title"], article.get("source"), sent_at)
+                  for article in articles])
+
+    def top_k(self, k: int = 10, since: Optional[float] = None, until: Optional[float] = None,
+              source: Optional[str] = None, category: Optional[str] = None,
+              worth_reading_only: bool = True, include_sent: bool = True,
+              min_impact: Optional[float] = None, min_originality: Optional[float] = None) -> List[Dict]:
+        """Best evaluated articles in a time window, in the same shape curate_articles returns."""
+        conditions, params = ["evaluation IS NOT NULL"], []
+        if min_impact is not None:
+            conditions.append("impact_score >= ?")
+            params.append(min_impact)
+        if min_originality is not None:
+            conditions.append("originality_score >= ?")
+            params.append(min_originality)
+        if since is not None:
+            conditions.append("evaluated_at >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("evaluated_at < ?")
+            params.append(until)
+        if source is not None:
+            conditions.append("source = ?")
+            params.append(source)
+        if category is not None:
+            conditions.append("category = ?")
+            params.append(category)
+        if worth_reading_only:
+            conditions.append("worth_reading = 1")
+        if not include_sent:
+            conditions.append("sent_at IS NULL")
+
+        rows = self.conn.execute(
+            f"SELECT title, url, source, evaluation FROM evaluations WHERE {' AND '.join(conditions)} "
+            f"ORDER BY combined_score DESC, evaluated_at DESC LIMIT ?",
+            params + [k]
+        )
+        return [{"title": title, "url": url, "source": source, "evaluation": json.loads(evaluation)}
+                for title, url, source, evaluation in rows]
+
+    def source_quality(self, since: Optional[float] = None, min_count: int = 1) -> List[Dict]:
+        """Per-source average score and share of articles worth reading, best first."""
+        where, params = ("AND evaluated_at >= ?", [since]) if since is not None else ("", [])
+        rows = self.conn.execute(f"""
+            SELECT source, COUNT(*), AVG(combined_score), AVG(worth_reading)
+            FROM evaluations WHERE evaluation IS NOT NULL {where}
+            GROUP BY source HAVING COUNT(*) >= ?
+            ORDER BY AVG(combined_score) DESC
+        """, params + [min_count])
+        return [{"source": source, "count": count, "avg_score": avg_score, "worth_reading_rate": rate}
+                for source, count, avg_score, rate in rows]
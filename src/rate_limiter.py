@@ -0,0 +1,178 @@
+# src/rate_limiter.py
+import asyncio
+import random
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+class TokenBucket:
+    """Token bucket whose rate backs off on 429s and creeps back up on success."""
+
+    def __init__(self, rate: float, burst: float = 1.0, min_rate: Optional[float] = None):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = max(burst, 1.0)
+        self.min_rate = min_rate if min_rate is not None else rate / 16
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def refill(self, now: float):
+        # Before `updated` (during a penalty pause) this subtracts, so reservations
+        # made during the pause queue up behind its end
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, now: float) -> float:
+        """Take a token and return how long the caller must wait before using it.
+
+        Tokens may go negative, so concurrent callers queue up behind each other
+        instead of all waking at the same moment."""
+        self.refill(now)
+        self.tokens -= 1
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.blocked_until - now)
+
+
+class RateLimiter:
+    """Process-wide limiter service keyed by host or API name.
+
+    Thread-safe via a single short lock; `acquire_async` gives the same guarantees to
+    coroutines without blocking the event loop. Each process (e.g. queue worker) has
+    its own limiter, so processes calling the same APIs split the rates between them
+    via `set_share`."""
+
+    def __init__(self, default_rate: float = 1.0, default_burst: float = 1.0):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.share = 1
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.lock = threading.Lock()
+
+    def configure(self, key: str, rate: float, burst: float = 1.0, min_rate: Optional[float] = None):
+        """Set the maximum rate (requests per second, for all processes together) for a key."""
+        with self.lock:
+            self.buckets[key] = TokenBucket(rate / self.share, burst,
+                                            min_rate / self.share if min_rate is not None else None)
+
+    def set_share(self, share: int):
+        """Give this process 1/`share` of every rate, for `share` processes using the same APIs."""
+        share = max(int(share), 1)
+        with self.lock:
+            factor = self.share / share
+            for bucket in self.buckets.values():
+                bucket.max_rate *= factor
+                bucket.rate *= factor
+                bucket.min_rate *= factor
+            self.share = share
+
+    def _bucket(self, key: str, rate: Optional[float]) -> TokenBucket:
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket((rate or self.default_rate) / self.share, self.default_burst)
+            self.buckets[key] = bucket
+        return bucket
+
+    def _reserve(self, key: str, rate: Optional[float]) -> float:
+        with self.lock:
+            return self._bucket(key, rate).reserve(time.monotonic())
+
+    def acquire(self, key: str, rate: Optional[float] = None):
+        """Block until a request to `key` is allowed. `rate` (for all processes together)
+        only applies to new keys."""
+        wait = self._reserve(key, rate)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, key: str, rate: Optional[float] = None):
+        wait = self._reserve(key, rate)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def penalize(self, key: str, retry_after: Optional[float] = None):
+        """Record a 429/overload: halve the rate and pause the key for Retry-After."""
+        with self.lock:
+            now = time.monotonic()
+            bucket = self._bucket(key, None)
+            bucket.refill(now)
+            bucket.rate = max(bucket.min_rate, bucket.rate / 2)
+            pause = retry_after if retry_after is not None else 1.0 / bucket.rate
+            bucket.blocked_until = max(bucket.blocked_until, now + pause)
+            # Tokens only start accruing when the pause ends, with one ready then: callers
+            # resume one interval apart instead of all waking at blocked_until
+            bucket.tokens = min(bucket.tokens, 0.0) + 1.0
+            bucket.updated = bucket.blocked_until
+
+    def reward(self, key: str):
+        """Record a success: grow the rate back towards its maximum."""
+        with self.lock:
+            bucket = self.buckets.get(key)
+            if bucket is not None and bucket.rate < bucket.max_rate:
+                bucket.rate = min(bucket.max_rate, bucket.rate + bucket.max_rate / 10)
+
+    def report(self, key: str, status_code: int, headers=None) -> bool:
+        """Feed an HTTP response back into the limiter. Returns True if it was throttled."""
+        if status_code in (429, 503):
+            self.penalize(key, parse_retry_after((headers or {}).get('Retry-After')))
+            return True
+        self.reward(key)
+        return False
+
+
+def parse_retry_after(value) -> Optional[float]:
+    """Retry-After as seconds; accepts delta-seconds or an HTTP date."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    if re.fullmatch(r'\d+(\.\d+)?', value):
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Whether an API client exception means we were throttled (HTTP 429 / quota)."""
+    if getattr(error, 'code', None) == 429 or getattr(error, 'status_code', None) == 429:
+        return True
+    if type(error).__name__ in ('ResourceExhausted', 'TooManyRequests', 'RateLimitError'):
+        return True
+    # Clients that don't expose a status still put it in the message ("429 Too Many Requests");
+    # only a standalone 429 counts, not one inside a URL or id
+    return re.search(r'(?<![\w/.-])429(?![\w/.-])', str(error)) is not None
+
+
+def retry_after_from_error(error: Exception) -> Optional[float]:
+    """Best-effort server retry delay from an API exception."""
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if headers and headers.get('Retry-After'):
+        return parse_retry_after(headers.get('Retry-After'))
+
+    # Gemini quota errors carry e.g. "retry_delay { seconds: 37 }"
+    match = re.search(r'retry_delay\s*\{\s*seconds:\s*(\d+)', str(error))
+    if match:
+        return float(match.group(1))
+    return None
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """Exponential backoff with full jitter for retry number `attempt` (0-based)."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def host_key(url: str) -> str:
+    """Limiter key for a URL: its host name."""
+    return urlparse(url).netloc.lower().split(':')[0]
+
+
+_limiter = RateLimiter()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Shared limiter used by every extractor, the content fetcher and Gemini calls."""
+    return _limiter
@@ -1,17 +1,143 @@
+import atexit
 import logging
-from typing import Dict, Any
+import logging.handlers
+import queue
+import threading
+import time
+from typing import Dict, Any, Optional
 import json
 
-def setup_logging():
-    """Configure logging for the application."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('curator.log'),
-            logging.StreamHandler()
-        ]
-    )
+# Attributes every LogRecord has; anything else was passed via `extra=`
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including any `extra=` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': round(record.created, 3),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        entry.update((key, value) for key, value in vars(record).items() if key not in _RECORD_ATTRS)
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Rate-limit per-item messages tagged with `extra={'sample_key': ...}`.
+
+    Lets through at most `burst` records per key every `interval` seconds; the next
+    record that passes carries a `suppressed` count. Untagged records always pass."""
+
+    def __init__(self, interval: float = 5.0, burst: int = 5):
+        super().__init__()
+        self.interval = interval
+        self.burst = burst
+        self.windows: Dict[str, list] = {}  # key -> [window start, passed, suppressed]
+        self.lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = getattr(record, 'sample_key', None)
+        if key is None:
+            return True
+
+        now = time.monotonic()
+        with self.lock:
+            window = self.windows.setdefault(key, [now, 0, 0])
+            if now - window[0] >= self.interval:
+                window[0], window[1] = now, 0
+            if window[1] >= self.burst:
+                window[2] += 1
+                return False
+            window[1] += 1
+            if window[2]:
+                record.suppressed = window[2]
+                window[2] = 0
+        return True
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue the record as-is; message formatting happens on the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class ProgressReporter:
+    """Logs progress, throughput and ETA at most once per `interval` seconds."""
+
+    def __init__(self, total: int, label: str, logger: Optional[logging.Logger] = None,
+                 interval: float = 5.0):
+        self.total = total
+        self.label = label
+        self.logger = logger or logging.getLogger(__name__)
+        self.interval = interval
+        self.done = 0
+        self.started = time.monotonic()
+        self.last_report = self.started
+        self.reported = 0
+        self.lock = threading.Lock()
+
+    def update(self, count: int = 1):
+        with self.lock:
+            self.done += count
+            now = time.monotonic()
+            if now - self.last_report < self.interval and self.done < self.total:
+                return
+            self.last_report = now
+            self.reported = done = self.done
+        self._report(done, now)
+
+    def _report(self, done: int, now: float):
+        elapsed = max(now - self.started, 1e-6)
+        rate = done / elapsed
+        eta = (self.total - done) / rate if rate > 0 else 0.0
+        self.logger.info(
+            f"{self.label}: {done}/{self.total} ({rate:.2f}/s, ETA {eta:.0f}s)",
+            extra={'progress': self.label, 'done': done, 'total': self.total,
+                   'rate': round(rate, 3), 'eta_seconds': round(eta, 1)}
+        )
+
+    def close(self):
+        """Log the final count if the last update wasn't reported."""
+        with self.lock:
+            done = self.done
+            report = done != self.reported
+            self.reported = done
+        if report:
+            self._report(done, time.monotonic())
+
+
+def setup_logging(log_file: str = 'curator.log', level: int = logging.INFO,
+                  sample_interval: float = 5.0, sample_burst: int = 5):
+    """Configure non-blocking logging for the application.
+
+    Callers only put records on an in-memory queue; a background listener writes JSON
+    lines to `log_file` and readable lines to the console."""
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(JsonFormatter())
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = _DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(sample_interval, sample_burst))
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+
+    listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler,
+                                              respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
 
 def load_config(config_path: str) -> Dict[str, Any]:
     """Load configuration from JSON file."""
@@ -19,4 +145,4 @@ def load_config(config_path: str) -> Dict[str, Any]:
         with open(config_path, 'r') as f:
             return json.load(f)
     except FileNotFoundError:
-        return {}
\ No newline at end of file
+        return {}
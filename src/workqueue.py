@@ -0,0 +1,197 @@
+# src/workqueue.py
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional
+
+class Task:
+    def __init__(self, task_id: str, stage: str, payload: Any, attempts: int):
+        self.task_id = task_id
+        self.stage = stage
+        self.payload = payload
+        self.attempts = attempts
+
+
+class WorkQueue:
+    """SQLite-backed task queue with leases, retries and idempotent results.
+
+    Every process (or node, with the file on a shared filesystem that implements POSIX
+    locks correctly) opens its own WorkQueue on the same path. Task ids are chosen by the producer, so re-submitting a task that
+    already exists is a no-op and finished work is never redone."""
+
+    def __init__(self, path: str, lease_seconds: float = 600, max_attempts: int = 3,
+                 retry_delay: float = 5.0):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=60, isolation_level=None)
+        # Rollback journal rather than WAL: WAL's shared-memory index only works for
+        # processes on one host, and the queue may be shared between nodes
+        self.conn.execute("PRAGMA journal_mode=DELETE")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                task_id TEXT PRIMARY KEY,
+                stage TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                available_at REAL NOT NULL DEFAULT 0,
+                lease_until REAL NOT NULL DEFAULT 0,
+                worker TEXT,
+                error TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_tasks_runnable ON tasks (status, available_at);
+            CREATE INDEX IF NOT EXISTS idx_tasks_stage ON tasks (stage, status);
+            CREATE TABLE IF NOT EXISTS results (
+                task_id TEXT PRIMARY KEY,
+                stage TEXT NOT NULL,
+                result TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                started_at REAL NOT NULL
+            );
+        """)
+
+    def close(self):
+        self.conn.close()
+
+    def put(self, task_id: str, stage: str, payload: Any) -> bool:
+        """Queue a task unless one with the same id already exists. Returns True if added."""
+        cursor = self.conn.execute(
+            "INSERT OR IGNORE INTO tasks (task_id, stage, payload) VALUES (?, ?, ?)",
+            (task_id, stage, json.dumps(payload))
+        )
+        return cursor.rowcount > 0
+
+    def put_many(self, tasks: List[tuple]) -> int:
+        """Queue (task_id, stage, payload) tuples in one transaction."""
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            cursor = self.conn.executemany(
+                "INSERT OR IGNORE INTO tasks (task_id, stage, payload) VALUES (?, ?, ?)",
+                [(task_id, stage, json.dumps(payload)) for task_id, stage, payload in tasks]
+            )
+        return cursor.rowcount
+
+    def lease(self, worker: str, stages: Optional[List[str]] = None,
+              run_ids: Optional[List[str]] = None) -> Optional[Task]:
+        """Claim the next runnable task: pending, or leased by a worker whose lease expired.
+
+        Expired leases that already used max_attempts are marked failed instead.
+        `run_ids` restricts leasing to tasks of those runs (task ids are "run_id:...")."""
+        now = time.time()
+        query = """
+            SELECT task_id, stage, payload, attempts FROM tasks
+            WHERE ((status = 'pending' AND available_at <= ?) OR (status = 'leased' AND lease_until < ?))
+        """
+        params: list = [now, now]
+        if stages:
+            query += f" AND stage IN ({','.join('?' for _ in stages)})"
+            params.extend(stages)
+        if run_ids:
+            query += f" AND substr(task_id, 1, instr(task_id, ':') - 1) IN ({','.join('?' for _ in run_ids)})"
+            params.extend(run_ids)
+        query += " ORDER BY available_at, rowid LIMIT 1"
+
+        with self.conn:
+            # Take the write lock up front so two workers can't claim the same row
+            self.conn.execute("BEGIN IMMEDIATE")
+            # A task whose worker keeps dying (OOM, crash) never calls fail(); give up on it
+            # once an expired lease has used up its attempts
+            self.conn.execute(
+                "UPDATE tasks SET status = 'failed', lease_until = 0, "
+                "error = COALESCE(error, 'lease expired') "
+                "WHERE status = 'leased' AND lease_until < ? AND attempts >= ?",
+                (now, self.max_attempts)
+            )
+            row = self.conn.execute(query, params).fetchone()
+            if row is None:
+                return None
+            task_id, stage, payload, attempts = row
+            self.conn.execute(
+                "UPDATE tasks SET status = 'leased', attempts = ?, lease_until = ?, worker = ? WHERE task_id = ?",
+                (attempts + 1, now + self.lease_seconds, worker, task_id)
+            )
+        return Task(task_id, stage, json.loads(payload), attempts + 1)
+
+    def complete(self, task: Task, result: Any):
+        """Store a task's result. The first result recorded for a task wins."""
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.execute(
+                "INSERT OR IGNORE INTO results (task_id, stage, result) VALUES (?, ?, ?)",
+                (task.task_id, task.stage, json.dumps(result))
+            )
+            self.conn.execute(
+                "UPDATE tasks SET status = 'done', lease_until = 0, error = NULL WHERE task_id = ?",
+                (task.task_id,)
+            )
+
+    def fail(self, task: Task, error: str):
+        """Release a failed task for retry with backoff, or give up after max_attempts."""
+        if task.attempts >= self.max_attempts:
+            status, available_at = 'failed', 0
+        else:
+            status, available_at = 'pending', time.time() + self.retry_delay * (2 ** (task.attempts - 1))
+        self.conn.execute(
+            "UPDATE tasks SET status = ?, available_at = ?, lease_until = 0, error = ? "
+            "WHERE task_id = ? AND status = 'leased'",
+            (status, available_at, error, task.task_id)
+        )
+
+    def outstanding(self, stages: Optional[List[str]] = None, prefix: str = '') -> int:
+        """Number of tasks (optionally with a task id prefix) not yet done or failed."""
+        query = "SELECT COUNT(*) FROM tasks WHERE status IN ('pending', 'leased') AND substr(task_id, 1, ?) = ?"
+        params: list = [len(prefix), prefix]
+        if stages:
+            query += f" AND stage IN ({','.join('?' for _ in stages)})"
+            params.extend(stages)
+        return self.conn.execute(query, params).fetchone()[0]
+
+    def failed(self, prefix: str = '') -> int:
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM tasks WHERE status = 'failed' AND substr(task_id, 1, ?) = ?",
+            (len(prefix), prefix)
+        ).fetchone()[0]
+
+    def results(self, stage: str, prefix: str = '') -> Dict[str, Any]:
+        """Results for a stage in task submission order, keyed by task id."""
+        rows = self.conn.execute(
+            "SELECT r.task_id, r.result FROM results r JOIN tasks t ON t.task_id = r.task_id "
+            "WHERE r.stage = ? AND substr(r.task_id, 1, ?) = ? ORDER BY t.rowid",
+            (stage, len(prefix), prefix)
+        )
+        return {task_id: json.loads(result) for task_id, result in rows}
+
+    def get_payload(self, task_id: str) -> Any:
+        row = self.conn.execute("SELECT payload FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def open_run(self, run_id: str):
+        """Mark a run as open: its coordinator may still add tasks to it."""
+        self.conn.execute(
+            "INSERT INTO runs (run_id, status, started_at) VALUES (?, 'open', ?) "
+            "ON CONFLICT(run_id) DO UPDATE SET status = 'open'",
+            (run_id, time.time())
+        )
+
+    def close_run(self, run_id: str):
+        """Tell workers serving this run that no more tasks will arrive."""
+        self.conn.execute("UPDATE runs SET status = 'closed' WHERE run_id = ?", (run_id,))
+
+    def run_status(self, run_id: str) -> Optional[str]:
+        """'open', 'closed', or None if the run hasn't been started yet."""
+        row = self.conn.execute("SELECT status FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return row[0] if row else None
+
+    def open_runs(self) -> List[str]:
+        """Open runs, most recently started first."""
+        rows = self.conn.execute("SELECT run_id FROM runs WHERE status = 'open' ORDER BY started_at DESC")
+        return [run_id for (run_id,) in rows]
@@ -3,22 +3,26 @@ import os
 from dotenv import load_dotenv
 from src.curator import EnhancedArticleCurator
 from src.email_digest import EmailDigest
+from src.condenser import condense_text
+from src.utils import setup_logging
 import time
 
 def test_single_source():
     """Test with just one source to verify the pipeline."""
     load_dotenv()  # Load environment variables
+    setup_logging()
     
     # Initialize curator with just Reddit for testing
     curator = EnhancedArticleCurator(
         gemini_api_key=os.getenv('GEMINI_API_KEY'),
         reddit_client_id=os.getenv('REDDIT_CLIENT_ID'),
-        reddit_client_secret=os.getenv('REDDIT_CLIENT_SECRET')
+        reddit_client_secret=os.getenv('REDDIT_CLIENT_SECRET'),
+        sources=['reddit']
     )
     
     # Test Reddit extraction
     print("\nTesting Reddit extraction...")
-    reddit_articles = curator.reddit_extractor.get_articles(days_ago=1)
+    reddit_articles = curator.get_extractor('reddit').get_articles(days_ago=1)
     print(f"Found {len(reddit_articles)} Reddit articles")
     if reddit_articles:
         print("Sample article:", reddit_articles[0]['title'])
@@ -36,7 +40,7 @@ def test_single_source():
         # Prepare article data for batch evaluation
         articles_data = [{
             "title": reddit_articles[0]['title'],
-            "content": content[:3000],
+            "content": condense_text(content, curator.content_token_budget),
             "source": "Reddit",
             "is_paywalled": False
         }]